@@ -15,13 +15,23 @@ import os
 import sys
 import json
 import time
+import mmap
+import hashlib
 import requests
 import argparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from http_fixtures import add_fixture_arguments, open_fixtures
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,18 +39,246 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional HTTP/2 transport
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+TRANSPORT_ERRORS = (requests.exceptions.RequestException,)
+if HAS_HTTPX:
+    TRANSPORT_ERRORS += (httpx.HTTPError,)
+
+# Statuses retried by the transport layer (honouring Retry-After)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# PDF structure markers used for integrity verification
+PDF_MAGIC = b'%PDF-'
+PDF_EOF_MARKER = b'%%EOF'
+PDF_TRAILER_WINDOW = 1024  # %%EOF must appear within the last 1KB
+MIN_PDF_SIZE = 1000  # Assume valid PDFs are > 1KB
+HASH_CHUNK_SIZE = 1 << 20
+
+# Scheduling order for download_priority values (unknown priorities sort last)
+PRIORITY_ORDER = {'high': 0, 'medium': 1, 'low': 2}
+DEFAULT_MAX_LANES = 8
+
+# Progress display refresh interval (seconds); non-TTY output logs less often
+PROGRESS_INTERVAL = 1.0
+PROGRESS_LOG_INTERVAL = 10.0
+
+
+class DownloadMetrics:
+    """Thread-safe throughput, rate-limit and queue metrics for a download run."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_time = time.perf_counter()
+        self.end_time = None
+        self.total_jobs = 0
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.queue_depth = 0
+        self.domains = defaultdict(lambda: {
+            'files': 0,
+            'failures': 0,
+            'retries': 0,
+            'bytes': 0,
+            'transfer_seconds': 0.0,
+            'rate_limited_seconds': 0.0
+        })
+
+    def start(self, total_jobs: int, skipped: int) -> None:
+        with self._lock:
+            self.start_time = time.perf_counter()
+            self.total_jobs = total_jobs
+            self.skipped = skipped
+            self.queue_depth = total_jobs - skipped
+
+    def add_rate_limit_wait(self, domain: str, seconds: float) -> None:
+        with self._lock:
+            self.domains[domain]['rate_limited_seconds'] += seconds
+
+    def add_transfer(self, domain: str, seconds: float, num_bytes: int, retries: int) -> None:
+        with self._lock:
+            stats = self.domains[domain]
+            stats['transfer_seconds'] += seconds
+            stats['bytes'] += num_bytes
+            stats['retries'] += retries
+
+    def job_started(self) -> None:
+        with self._lock:
+            self.queue_depth -= 1
+
+    def job_finished(self, domain: str, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.completed += 1
+                self.domains[domain]['files'] += 1
+            else:
+                self.failed += 1
+                self.domains[domain]['failures'] += 1
+
+    def finish(self) -> None:
+        with self._lock:
+            self.end_time = time.perf_counter()
+
+    def _elapsed(self) -> float:
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def eta(self) -> Optional[float]:
+        """Seconds remaining, extrapolated from the average time per finished job."""
+        with self._lock:
+            done = self.completed + self.failed
+            remaining = self.total_jobs - self.skipped - done
+        if done == 0:
+            return None
+        return self._elapsed() / done * remaining
+
+    def format_progress(self) -> str:
+        with self._lock:
+            done = self.completed + self.failed
+            active = self.total_jobs - self.skipped
+            total_bytes = sum(d['bytes'] for d in self.domains.values())
+            queued = self.queue_depth
+        elapsed = self._elapsed()
+        rate = total_bytes / elapsed / 1024 if elapsed > 0 else 0.0
+        eta = self.eta()
+        eta_text = f"{eta:.0f}s" if eta is not None else '?'
+        return (f"[{done}/{active}] {self.completed} ok, {self.failed} failed, "
+                f"{queued} queued, {rate:.1f} KB/s, ETA {eta_text}")
+
+    def summary(self) -> Dict:
+        """Aggregate metrics suitable for JSON output."""
+        elapsed = self._elapsed()
+        with self._lock:
+            domains = {}
+            for domain, stats in self.domains.items():
+                transfer = stats['transfer_seconds']
+                waiting = stats['rate_limited_seconds']
+                domains[domain] = {
+                    **stats,
+                    'bytes_per_sec': stats['bytes'] / transfer if transfer > 0 else 0.0,
+                    'bottleneck': 'rate_limit' if waiting > transfer else 'transfer'
+                }
+
+            total_bytes = sum(d['bytes'] for d in self.domains.values())
+            return {
+                'timestamp': datetime.now().isoformat(),
+                'elapsed_seconds': elapsed,
+                'jobs': {
+                    'total': self.total_jobs,
+                    'completed': self.completed,
+                    'failed': self.failed,
+                    'skipped': self.skipped
+                },
+                'bytes': total_bytes,
+                'bytes_per_sec': total_bytes / elapsed if elapsed > 0 else 0.0,
+                'transfer_seconds': sum(d['transfer_seconds'] for d in self.domains.values()),
+                'rate_limited_seconds': sum(d['rate_limited_seconds'] for d in self.domains.values()),
+                'retries': sum(d['retries'] for d in self.domains.values()),
+                'domains': domains
+            }
+
+
+class ProgressReporter:
+    """Background thread rendering DownloadMetrics as a live progress line.
+
+    On a terminal the line is redrawn in place. While it is shown, root
+    log handlers writing to the same stream are wrapped so each record
+    first clears the line and then redraws it below the message.
+    """
+
+    def __init__(self, metrics: DownloadMetrics, stream=sys.stderr):
+        self.metrics = metrics
+        self.stream = stream
+        self.live = stream.isatty()
+        self._lock = threading.RLock()
+        self._line = ''
+        self._handlers: List[Tuple[logging.Handler, logging.Handler]] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        interval = PROGRESS_INTERVAL if self.live else PROGRESS_LOG_INTERVAL
+        while not self._stop.wait(interval):
+            self._render()
+
+    def _render(self) -> None:
+        line = self.metrics.format_progress()
+        if self.live:
+            with self._lock:
+                self._line = line
+                self._draw()
+        else:
+            logger.info(f"Progress: {line}")
+
+    def _draw(self) -> None:
+        self.stream.write(f"\r\033[K{self._line}")
+        self.stream.flush()
+
+    def emit_above(self, handler: logging.Handler, record: logging.LogRecord) -> None:
+        """Write a log record on its own line, then redraw the progress line."""
+        with self._lock:
+            self.stream.write('\r\033[K')
+            handler.handle(record)
+            self._draw()
+
+    def __enter__(self) -> 'ProgressReporter':
+        if self.live:
+            root = logging.getLogger()
+            for handler in list(root.handlers):
+                if isinstance(handler, logging.StreamHandler) and handler.stream is self.stream:
+                    wrapper = _ProgressLogHandler(self, handler)
+                    root.removeHandler(handler)
+                    root.addHandler(wrapper)
+                    self._handlers.append((handler, wrapper))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._render()
+        if self.live:
+            self.stream.write('\n')
+            root = logging.getLogger()
+            for handler, wrapper in self._handlers:
+                root.removeHandler(wrapper)
+                root.addHandler(handler)
+            self._handlers.clear()
+
+
+class _ProgressLogHandler(logging.Handler):
+    """Passes records to a wrapped handler without garbling the progress line."""
+
+    def __init__(self, reporter: ProgressReporter, handler: logging.Handler):
+        super().__init__(handler.level)
+        self.reporter = reporter
+        self.handler = handler
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.reporter.emit_above(self.handler, record)
+
+
 class PaperDownloader:
     """Handles downloading papers with respect for copyright and rate limiting."""
 
-    def __init__(self, base_dir: str, config_file: str):
+    def __init__(self, base_dir: str, config_file: str,
+                 verification_report: Optional[str] = None,
+                 http2: Optional[bool] = None, keep_history: bool = True):
         self.base_dir = Path(base_dir)
         self.config_file = Path(config_file)
-        self.session = requests.Session()
 
         # Load configuration
         with open(self.config_file, 'r') as f:
             self.config = json.load(f)
 
+        # Pooled keep-alive transport shared by all download lanes
+        self.session, self.transport_retries = self._build_session(http2)
+
         # Set user agent for ethical scraping
         self.session.headers.update({
             'User-Agent': self.config.get('download_policies', {}).get(
@@ -53,6 +291,134 @@ class PaperDownloader:
         self.rate_limits = self.config.get('download_policies', {}).get('rate_limiting', {})
         self.last_request_time = {}
 
+        # Offline fixtures (see http_fixtures.py): a FixtureStore to record
+        # into, or a FixtureServer to replay from
+        self.recorder = None
+        self.replay = None
+
+        # Metrics for the current (or last) download run
+        self.metrics = DownloadMetrics()
+
+        # Scheduling inputs: past failures per paper and the last verify_access.py run.
+        # Without keep_history (replay runs) no history is read or written.
+        self.history_file = self.config_file.parent / 'download_history.json' if keep_history else None
+        self.retry_history = self._load_json(self.history_file) if self.history_file else {}
+        self._history_lock = threading.Lock()
+
+        report_path = (Path(verification_report) if verification_report
+                       else self.config_file.parent / 'verification_report.json')
+        self.unavailable_domains, self.size_estimates = self._load_verification_report(report_path)
+
+        # Rolling per-host health scores written by verify_access.py (0..1, higher is better)
+        self.host_scores = {
+            host: entry.get('score', 1.0)
+            for host, entry in self._load_json(self.config_file.parent / 'host_health.json').items()
+        }
+
+    def _build_session(self, http2: Optional[bool] = None):
+        """Create the HTTP client from ``download_policies.connection_pool``.
+
+        Returns ``(session, transport_retries)``. The default is a
+        ``requests.Session`` with per-host pooled adapters and a urllib3
+        ``Retry`` built from ``retry_policy``; with ``http2`` enabled and
+        httpx (with h2) installed, an ``httpx.Client`` is used instead, which
+        multiplexes requests to a host over one connection.
+        """
+        policies = self.config.get('download_policies', {})
+        pool_config = policies.get('connection_pool', {})
+        retry_policy = policies.get('retry_policy', {})
+
+        pool_connections = pool_config.get('pool_connections', 10)
+        pool_maxsize = pool_config.get('pool_maxsize', 4)
+        if http2 is None:
+            http2 = pool_config.get('http2', False)
+
+        if http2:
+            if not HAS_HTTPX:
+                logger.warning("HTTP/2 requested but httpx is not installed; using requests")
+            else:
+                try:
+                    limits = httpx.Limits(
+                        max_connections=pool_connections * pool_maxsize,
+                        max_keepalive_connections=pool_connections,
+                        keepalive_expiry=pool_config.get('keepalive_expiry', 30)
+                    )
+                    transport = httpx.HTTPTransport(
+                        http2=True,
+                        limits=limits,
+                        retries=retry_policy.get('max_retries', 3)
+                    )
+                    client = httpx.Client(transport=transport, follow_redirects=True)
+                    # httpx only retries connection failures, so the
+                    # application-level retry loop stays active
+                    return client, False
+                except ImportError as e:
+                    logger.warning(f"HTTP/2 unavailable ({e}); using requests")
+
+        retries = Retry(
+            total=retry_policy.get('max_retries', 3),
+            backoff_factor=retry_policy.get('backoff_factor', 2),
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+
+        session = requests.Session()
+        default_adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retries
+        )
+        session.mount('http://', default_adapter)
+        session.mount('https://', default_adapter)
+
+        # Dedicated pools for hosts we fetch many papers from
+        for host, maxsize in pool_config.get('per_host', {}).items():
+            host_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize, max_retries=retries)
+            session.mount(f'http://{host}/', host_adapter)
+            session.mount(f'https://{host}/', host_adapter)
+
+        return session, True
+
+    @staticmethod
+    def _load_json(path: Path) -> Dict:
+        """Load a JSON file, returning an empty dict if it is missing or unreadable."""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _load_verification_report(self, report_path: Path) -> Tuple[set, Dict[str, int]]:
+        """Extract timed-out domains and Content-Length estimates from a verification report."""
+        report = self._load_json(report_path)
+        domain_statuses = defaultdict(set)
+        size_estimates = {}
+
+        for category_results in report.get('verification_results', {}).values():
+            for result in category_results:
+                url = result.get('url')
+                if not url:
+                    continue
+                domain_statuses[self._get_domain(url)].add(result.get('status'))
+
+                content_length = result.get('content_length')
+                if content_length and str(content_length).isdigit():
+                    size_estimates[url] = int(content_length)
+
+        # A host is only skipped when it timed out and never answered successfully
+        unavailable = {
+            domain for domain, statuses in domain_statuses.items()
+            if 'timeout' in statuses
+            and not any(str(s).startswith('accessible') for s in statuses)
+        }
+
+        if unavailable:
+            logger.info(f"Hosts timing out in last verification: {', '.join(sorted(unavailable))}")
+
+        return unavailable, size_estimates
+
     def _respect_rate_limit(self, domain: str) -> None:
         """Implement rate limiting for ethical downloading."""
         rate_limit = self.rate_limits.get(domain, self.rate_limits.get('general', 5))
@@ -63,6 +429,7 @@ class PaperDownloader:
                 sleep_time = rate_limit - elapsed
                 logger.info(f"Rate limiting: sleeping {sleep_time:.1f}s for {domain}")
                 time.sleep(sleep_time)
+                self.metrics.add_rate_limit_wait(domain, sleep_time)
 
         self.last_request_time[domain] = time.time()
 
@@ -70,7 +437,7 @@ class PaperDownloader:
         """Extract domain from URL for rate limiting."""
         return urlparse(url).netloc
 
-    def _download_file(self, url: str, output_path: Path, max_retries: int = 3) -> bool:
+    def _download_file(self, url: str, output_path: Path, max_retries: Optional[int] = None) -> bool:
         """Download a single file with retry logic."""
         domain = self._get_domain(url)
         self._respect_rate_limit(domain)
@@ -78,11 +445,41 @@ class PaperDownloader:
         retry_policy = self.config.get('download_policies', {}).get('retry_policy', {})
         backoff_factor = retry_policy.get('backoff_factor', 2)
 
+        # The requests transport already retries with backoff, so a single
+        # attempt here avoids multiplying retries
+        if self.transport_retries:
+            max_retries = 1
+        elif max_retries is None:
+            max_retries = retry_policy.get('max_retries', 3)
+
         for attempt in range(max_retries):
             try:
                 logger.info(f"Downloading {url} (attempt {attempt + 1}/{max_retries})")
 
-                response = self.session.get(url, timeout=30)
+                request_url = self.replay.rewrite(url) if self.replay else url
+                start_time = time.perf_counter()
+                response = self.session.get(request_url, timeout=30)
+
+                transfer_time = time.perf_counter() - start_time
+
+                # Retries performed inside the urllib3 transport, if any
+                retry_state = getattr(getattr(response, 'raw', None), 'retries', None)
+                transport_retries = len(retry_state.history) if retry_state else 0
+                self.metrics.add_transfer(domain, transfer_time, len(response.content),
+                                          (1 if attempt else 0) + transport_retries)
+
+                if self.recorder:
+                    # Each redirect hop keeps its own status and latency
+                    redirects = [
+                        {'url': str(hop.url), 'status': hop.status_code, 'latency': hop.elapsed.total_seconds()}
+                        for hop in response.history
+                    ]
+                    self.recorder.record(
+                        'GET', url, response.status_code, dict(response.headers), response.content,
+                        max(0.0, transfer_time - sum(hop['latency'] for hop in redirects)),
+                        str(response.url), redirects
+                    )
+
                 response.raise_for_status()
 
                 # Check if response is actually a PDF
@@ -100,7 +497,7 @@ class PaperDownloader:
                 logger.info(f"Successfully downloaded to {output_path}")
                 return True
 
-            except requests.exceptions.RequestException as e:
+            except TRANSPORT_ERRORS as e:
                 logger.error(f"Download failed (attempt {attempt + 1}): {e}")
                 if attempt < max_retries - 1:
                     sleep_time = backoff_factor ** attempt
@@ -115,6 +512,33 @@ class PaperDownloader:
         arxiv_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
         return self._download_file(arxiv_url, output_path)
 
+    def _effective_url(self, paper_info: Dict) -> Optional[str]:
+        """Return the URL a paper is actually fetched from."""
+        if paper_info.get('access_type') == 'AR' and 'arxiv_id' in paper_info:
+            return f"https://arxiv.org/pdf/{paper_info['arxiv_id']}.pdf"
+        return paper_info.get('url')
+
+    def _record_attempt(self, paper_id: str, success: bool) -> None:
+        """Update the persisted retry history after a download attempt."""
+        with self._history_lock:
+            if success:
+                self.retry_history.pop(paper_id, None)
+            else:
+                entry = self.retry_history.setdefault(paper_id, {'failures': 0})
+                entry['failures'] += 1
+                entry['last_attempt'] = datetime.now().isoformat()
+
+    def _save_retry_history(self) -> None:
+        """Persist retry history so the next run can deprioritise flaky papers."""
+        if self.history_file is None:
+            return
+        with self._history_lock:
+            try:
+                with open(self.history_file, 'w') as f:
+                    json.dump(self.retry_history, f, indent=2)
+            except OSError as e:
+                logger.warning(f"Could not save retry history: {e}")
+
     def download_paper(self, paper_info: Dict) -> bool:
         """Download a single paper based on its information."""
         url = paper_info.get('url')
@@ -140,7 +564,99 @@ class PaperDownloader:
         # Handle regular downloads
         return self._download_file(url, output_path)
 
-    def download_category(self, category: str) -> Tuple[int, int]:
+    def _schedule_key(self, job: Tuple[str, str, Dict]) -> Tuple:
+        """Sort key: priority, then past failures, then healthiest host, then smallest estimated size."""
+        _, paper_id, paper_info = job
+        priority = PRIORITY_ORDER.get(paper_info.get('download_priority'), len(PRIORITY_ORDER))
+        failures = self.retry_history.get(paper_id, {}).get('failures', 0)
+        url = self._effective_url(paper_info)
+        health = self.host_scores.get(self._get_domain(url), 1.0) if url else 1.0
+        # Sized by the URL actually fetched: an arXiv entry's url is the HTML abs page
+        size = self.size_estimates.get(url, float('inf'))
+        return (priority, failures, -health, size)
+
+    def schedule(self, jobs: List[Tuple[str, str, Dict]],
+                 skip_unavailable: bool = True) -> Dict[str, deque]:
+        """Group (category, paper_id, paper_info) jobs into ordered per-domain lanes.
+
+        Lanes are returned in order of their most urgent job, and each lane is
+        ordered by ``_schedule_key``. Jobs on hosts that timed out during the
+        last verification run are dropped when ``skip_unavailable`` is set.
+        """
+        lanes = defaultdict(list)
+
+        for job in sorted(jobs, key=self._schedule_key):
+            url = self._effective_url(job[2])
+            domain = self._get_domain(url) if url else ''
+
+            if skip_unavailable and domain in self.unavailable_domains:
+                logger.warning(f"Skipping {job[1]}: {domain} timed out in last verification")
+                continue
+
+            lanes[domain].append(job)
+
+        return {domain: deque(lane) for domain, lane in lanes.items()}
+
+    def _run_schedule(self, jobs: List[Tuple[str, str, Dict]], skip_unavailable: bool = True,
+                      max_lanes: int = DEFAULT_MAX_LANES) -> Dict[str, Tuple[int, int]]:
+        """Download scheduled jobs with one worker per domain lane."""
+        results = defaultdict(lambda: [0, 0])
+        results_lock = threading.Lock()
+
+        for category, _, _ in jobs:
+            results[category][1] += 1
+
+        lanes = self.schedule(jobs, skip_unavailable)
+
+        self.metrics = DownloadMetrics()
+        scheduled = sum(len(lane) for lane in lanes.values())
+        self.metrics.start(len(jobs), len(jobs) - scheduled)
+
+        def drain(domain: str, lane: deque) -> None:
+            # Each domain is drained by a single worker, so per-domain rate
+            # limiting stays sequential while other hosts download in parallel
+            while lane:
+                category, paper_id, paper_info = lane.popleft()
+                self.metrics.job_started()
+                logger.info(f"Processing: {paper_info.get('title', paper_id)}")
+
+                success = self.download_paper(paper_info)
+                self._record_attempt(paper_id, success)
+                self.metrics.job_finished(domain, success)
+
+                if success:
+                    with results_lock:
+                        results[category][0] += 1
+                else:
+                    logger.error(f"Failed to download: {paper_id}")
+
+        if lanes:
+            with ProgressReporter(self.metrics), \
+                    ThreadPoolExecutor(max_workers=min(len(lanes), max_lanes)) as executor:
+                futures = [executor.submit(drain, domain, lane) for domain, lane in lanes.items()]
+                for future in futures:
+                    future.result()
+
+        self.metrics.finish()
+        self._save_retry_history()
+        return {category: (success, total) for category, (success, total) in results.items()}
+
+    def save_metrics(self, output_file: Path) -> None:
+        """Write the metrics summary of the last run as JSON."""
+        summary = self.metrics.summary()
+        with open(output_file, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+        logger.info(
+            f"Transferred {summary['bytes'] / (1024 * 1024):.1f} MB at "
+            f"{summary['bytes_per_sec'] / 1024:.1f} KB/s; "
+            f"{summary['transfer_seconds']:.1f}s transferring, "
+            f"{summary['rate_limited_seconds']:.1f}s rate-limited, "
+            f"{summary['retries']} retries"
+        )
+        logger.info(f"Metrics saved to {output_file}")
+
+    def download_category(self, category: str, skip_unavailable: bool = True) -> Tuple[int, int]:
         """Download all papers in a specific category."""
         papers = self.config.get('download_sources', {}).get(category, {})
 
@@ -150,66 +666,162 @@ class PaperDownloader:
 
         logger.info(f"Downloading {len(papers)} papers from category: {category}")
 
-        success_count = 0
-        total_count = len(papers)
-
-        for paper_id, paper_info in papers.items():
-            logger.info(f"Processing: {paper_info.get('title', paper_id)}")
-
-            if self.download_paper(paper_info):
-                success_count += 1
-            else:
-                logger.error(f"Failed to download: {paper_id}")
+        jobs = [(category, paper_id, paper_info) for paper_id, paper_info in papers.items()]
+        success_count, total_count = self._run_schedule(jobs, skip_unavailable)[category]
 
         logger.info(f"Category {category}: {success_count}/{total_count} successful downloads")
         return success_count, total_count
 
-    def download_all(self, priorities: Optional[List[str]] = None) -> Dict[str, Tuple[int, int]]:
-        """Download all papers, optionally filtered by priority."""
-        download_sources = self.config.get('download_sources', {})
-        results = {}
-
-        if priorities:
-            # Filter papers by priority
-            filtered_sources = {}
-            for category, papers in download_sources.items():
-                filtered_papers = {
-                    pid: pinfo for pid, pinfo in papers.items()
-                    if pinfo.get('download_priority') in priorities
-                }
-                if filtered_papers:
-                    filtered_sources[category] = filtered_papers
-            download_sources = filtered_sources
-
-        for category in download_sources:
-            success, total = self.download_category(category)
-            results[category] = (success, total)
-
-        return results
-
-    def verify_downloads(self) -> Dict[str, Dict[str, bool]]:
-        """Verify that downloaded files exist and are valid."""
+    def download_all(self, priorities: Optional[List[str]] = None,
+                     skip_unavailable: bool = True) -> Dict[str, Tuple[int, int]]:
+        """Download all papers across categories, optionally filtered by priority.
+
+        Work is scheduled globally rather than category by category, so
+        high-priority papers land first even in partial runs.
+        """
+        jobs = [
+            (category, paper_id, paper_info)
+            for category, papers in self.config.get('download_sources', {}).items()
+            for paper_id, paper_info in papers.items()
+            if not priorities or paper_info.get('download_priority') in priorities
+        ]
+
+        return self._run_schedule(jobs, skip_unavailable)
+
+    def _verify_file(self, local_path: Path, expected_sha256: Optional[str] = None) -> Dict:
+        """Check PDF magic, %%EOF trailer and SHA-256 digest of a single file."""
+        result = {
+            'path': str(local_path),
+            'valid': False,
+            'size': 0,
+            'sha256': None,
+            'issues': []
+        }
+
+        if not local_path.is_file():
+            result['issues'].append('missing')
+            return result
+
+        try:
+            with open(local_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                result['size'] = size
+
+                if size == 0:
+                    # mmap cannot map empty files
+                    result['issues'].append('empty file')
+                    return result
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if size < MIN_PDF_SIZE:
+                        result['issues'].append(f'suspicious size: {size} bytes')
+                    if mm[:len(PDF_MAGIC)] != PDF_MAGIC:
+                        result['issues'].append('missing %PDF- header')
+                    if mm.rfind(PDF_EOF_MARKER, max(0, size - PDF_TRAILER_WINDOW)) == -1:
+                        result['issues'].append('missing %%EOF trailer')
+
+                    # hashlib releases the GIL on large buffers, so worker
+                    # threads hash in parallel straight from the page cache
+                    digest = hashlib.sha256()
+                    view = memoryview(mm)
+                    try:
+                        for offset in range(0, size, HASH_CHUNK_SIZE):
+                            digest.update(view[offset:offset + HASH_CHUNK_SIZE])
+                    finally:
+                        view.release()
+                    result['sha256'] = digest.hexdigest()
+
+        except (OSError, ValueError) as e:
+            result['issues'].append(f'read error: {e}')
+            return result
+
+        if expected_sha256 and result['sha256'] != expected_sha256.lower():
+            result['issues'].append('sha256 mismatch')
+
+        result['valid'] = not result['issues']
+        return result
+
+    def verify_downloads(self, max_workers: Optional[int] = None, manifest_file: Optional[Path] = None,
+                         update_manifest: bool = False) -> Dict[str, Dict[str, bool]]:
+        """Verify that downloaded files exist and are structurally valid PDFs.
+
+        Digests are compared with the checksum manifest (``local_path`` ->
+        SHA-256), falling back to a paper's ``sha256`` field. With
+        ``update_manifest`` the digest of every readable PDF is written back,
+        so later runs have something to compare against.
+
+        Files are checked in a thread pool; per-file details (digest, issues)
+        are kept in ``self.verification_details`` and aggregate throughput in
+        ``self.verification_stats``.
+        """
         verification_results = {}
+        jobs = []
+        manifest = self._load_json(manifest_file) if manifest_file else {}
 
         for category, papers in self.config.get('download_sources', {}).items():
             verification_results[category] = {}
 
             for paper_id, paper_info in papers.items():
-                local_path = self.base_dir / paper_info.get('local_path', '')
-
-                if local_path.exists():
-                    # Basic validation: check file size
-                    file_size = local_path.stat().st_size
-                    if file_size > 1000:  # Assume valid PDFs are > 1KB
-                        verification_results[category][paper_id] = True
-                    else:
-                        verification_results[category][paper_id] = False
-                        logger.warning(f"Suspicious file size for {paper_id}: {file_size} bytes")
-                else:
-                    verification_results[category][paper_id] = False
+                relative_path = paper_info.get('local_path', '')
+                expected = manifest.get(relative_path) or paper_info.get('sha256')
+                jobs.append((category, paper_id, self.base_dir / relative_path, expected))
+
+        self.verification_details = {}
+        start_time = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (category, paper_id, executor.submit(self._verify_file, local_path, expected))
+                for category, paper_id, local_path, expected in jobs
+            ]
+
+            for category, paper_id, future in futures:
+                details = future.result()
+                self.verification_details.setdefault(category, {})[paper_id] = details
+                verification_results[category][paper_id] = details['valid']
+
+                if details['issues'] and details['issues'] != ['missing']:
+                    logger.warning(f"Integrity check failed for {paper_id}: {', '.join(details['issues'])}")
+                if details['sha256']:
+                    logger.info(f"  {paper_id}: sha256 {details['sha256']}")
+
+        elapsed = time.perf_counter() - start_time
+        total_bytes = sum(
+            details['size']
+            for papers in self.verification_details.values()
+            for details in papers.values()
+        )
+        self.verification_stats = {
+            'files': len(jobs),
+            'bytes': total_bytes,
+            'seconds': elapsed,
+            'mb_per_sec': (total_bytes / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0,
+            'digests_compared': sum(1 for *_, expected in jobs if expected)
+        }
+
+        if update_manifest and manifest_file:
+            self._save_manifest(manifest_file, manifest)
 
         return verification_results
 
+    def _save_manifest(self, manifest_file: Path, manifest: Dict[str, str]) -> None:
+        """Record the digest of every readable PDF from the last verification."""
+        updated = 0
+        for category, papers in self.verification_details.items():
+            for paper_id, details in papers.items():
+                # A changed digest is accepted; structurally broken files are not
+                if details['sha256'] and set(details['issues']) <= {'sha256 mismatch'}:
+                    relative_path = self.config['download_sources'][category][paper_id].get('local_path', '')
+                    updated += manifest.get(relative_path) != details['sha256']
+                    manifest[relative_path] = details['sha256']
+
+        try:
+            with open(manifest_file, 'w') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            logger.info(f"Checksum manifest saved to {manifest_file} ({updated} digests updated)")
+        except OSError as e:
+            logger.warning(f"Could not save checksum manifest: {e}")
+
 
 def main():
     """Main entry point for the download script."""
@@ -229,6 +841,24 @@ def main():
                        help='Verify existing downloads instead of downloading')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be downloaded without downloading')
+    parser.add_argument('--workers', type=int,
+                       help='Worker threads for --verify (default: CPU-based)')
+    parser.add_argument('--manifest',
+                       help='Checksum manifest for --verify (default: checksums.json next to the config)')
+    parser.add_argument('--update-manifest', action='store_true',
+                       help='With --verify, write the computed SHA-256 digests to the manifest')
+    parser.add_argument('--verification-report',
+                       help='verify_access.py report used for scheduling '
+                            '(default: verification_report.json next to the config)')
+    parser.add_argument('--include-unavailable', action='store_true',
+                       help='Also download from hosts that timed out in the last verification')
+    parser.add_argument('--http2', action='store_true', default=None,
+                       help='Use the HTTP/2 transport (requires httpx[http2])')
+    parser.add_argument('--metrics-output',
+                       help='JSON metrics summary for download runs '
+                            '(default: download_metrics.json next to the config, '
+                            'not written for --replay runs)')
+    add_fixture_arguments(parser)
 
     args = parser.parse_args()
 
@@ -248,11 +878,16 @@ def main():
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
 
-    downloader = PaperDownloader(output_dir, config_path)
+    # Replayed failures (e.g. --replay-error-rate) must not leak into the real
+    # retry history or default metrics
+    downloader = PaperDownloader(output_dir, config_path, args.verification_report, args.http2,
+                                 keep_history=not args.replay)
+    skip_unavailable = not args.include_unavailable
 
     if args.verify:
         logger.info("Verifying existing downloads...")
-        results = downloader.verify_downloads()
+        manifest_file = Path(args.manifest) if args.manifest else config_path.parent / 'checksums.json'
+        results = downloader.verify_downloads(args.workers, manifest_file, args.update_manifest)
 
         total_papers = 0
         valid_papers = 0
@@ -267,6 +902,13 @@ def main():
 
         logger.info(f"Overall: {valid_papers}/{total_papers} papers verified")
 
+        stats = downloader.verification_stats
+        logger.info(
+            f"Checked {stats['bytes'] / (1024 * 1024):.1f} MB in {stats['seconds']:.2f}s "
+            f"({stats['mb_per_sec']:.1f} MB/s)"
+        )
+        logger.info(f"{stats['digests_compared']} digests compared (manifest: {manifest_file})")
+
     elif args.dry_run:
         logger.info("Dry run mode - showing what would be downloaded:")
 
@@ -277,29 +919,41 @@ def main():
                 logger.info(f"  - {paper_info.get('title', paper_id)}")
         else:
             priorities = [args.priority] if args.priority else None
-            for category, papers in downloader.config.get('download_sources', {}).items():
-                if priorities:
-                    papers = {
-                        pid: pinfo for pid, pinfo in papers.items()
-                        if pinfo.get('download_priority') in priorities
-                    }
-                if papers:
-                    logger.info(f"Category {category}: {len(papers)} papers")
+            jobs = [
+                (category, paper_id, paper_info)
+                for category, papers in downloader.config.get('download_sources', {}).items()
+                for paper_id, paper_info in papers.items()
+                if not priorities or paper_info.get('download_priority') in priorities
+            ]
+            for domain, lane in downloader.schedule(jobs, skip_unavailable).items():
+                logger.info(f"Lane {domain}: {len(lane)} papers")
+                for category, paper_id, paper_info in lane:
+                    logger.info(f"  - [{paper_info.get('download_priority', '?')}] "
+                                f"{category}/{paper_id}: {paper_info.get('title', paper_id)}")
 
     else:
-        if args.category:
-            success, total = downloader.download_category(args.category)
-            logger.info(f"Downloaded {success}/{total} papers from {args.category}")
-        else:
-            priorities = [args.priority] if args.priority else None
-            results = downloader.download_all(priorities)
+        with open_fixtures(args) as (recorder, replay):
+            downloader.recorder = recorder
+            downloader.replay = replay
+
+            if args.category:
+                success, total = downloader.download_category(args.category, skip_unavailable)
+                logger.info(f"Downloaded {success}/{total} papers from {args.category}")
+            else:
+                priorities = [args.priority] if args.priority else None
+                results = downloader.download_all(priorities, skip_unavailable)
+
+                total_success = sum(s for s, t in results.values())
+                total_papers = sum(t for s, t in results.values())
 
-            total_success = sum(s for s, t in results.values())
-            total_papers = sum(t for s, t in results.values())
+                logger.info(f"Overall download results: {total_success}/{total_papers} successful")
+                for category, (success, total) in results.items():
+                    logger.info(f"  {category}: {success}/{total}")
 
-            logger.info(f"Overall download results: {total_success}/{total_papers} successful")
-            for category, (success, total) in results.items():
-                logger.info(f"  {category}: {success}/{total}")
+        if args.metrics_output:
+            downloader.save_metrics(Path(args.metrics_output))
+        elif not args.replay:
+            downloader.save_metrics(config_path.parent / 'download_metrics.json')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Lambda Calculus Papers Archive - HTTP Fixture Recording and Replay
+
+Records real HTTP responses (status, headers, body hash, latency) made by
+download_papers.py and verify_access.py, and replays them offline through a
+local stand-in HTTP server with configurable latency and error injection.
+This makes throughput and concurrency measurements deterministic without
+touching arXiv or publisher sites.
+
+Fixture directory layout:
+    index.json          # "METHOD url" -> response record
+    bodies/<sha256>     # content-addressed response bodies
+
+Each redirect hop is its own record (status, Location and latency), so a
+replayed chain answers with the recorded statuses and pays each hop's
+latency once.
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Headers that describe the original connection rather than the resource
+HOP_BY_HOP_HEADERS = {
+    'connection', 'keep-alive', 'transfer-encoding', 'content-encoding',
+    'content-length', 'proxy-connection', 'upgrade', 'te', 'trailer'
+}
+
+
+class FixtureStore:
+    """Content-addressed store of recorded HTTP responses."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.index_file = self.directory / 'index.json'
+        self.bodies_dir = self.directory / 'bodies'
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.index_file, 'r') as f:
+                self.records = json.load(f)
+        except (OSError, ValueError):
+            self.records = {}
+
+    @staticmethod
+    def _key(method: str, url: str) -> str:
+        return f"{method.upper()} {url}"
+
+    def record(self, method: str, url: str, status: int, headers: Dict[str, str],
+               body: Optional[bytes], latency: float, final_url: Optional[str] = None,
+               redirects: Optional[List[Dict]] = None, partial: bool = False) -> None:
+        """Store one response and the redirect hops that led to it.
+
+        ``redirects`` lists each redirect response as ``{'url', 'status',
+        'latency'}`` in request order; the final response is stored under
+        ``final_url`` with its own ``latency``. ``body`` is None when it was
+        not read, and ``partial`` marks a body cut short by a Range request.
+        Recordings without a full body never replace one that has it.
+        """
+        body_sha256 = None
+        if body is not None:
+            body_sha256 = hashlib.sha256(body).hexdigest()
+            body_path = self.bodies_dir / body_sha256
+            if not body_path.exists():
+                self.bodies_dir.mkdir(parents=True, exist_ok=True)
+                body_path.write_bytes(body)
+
+        redirects = redirects or []
+        final_url = final_url or url
+        entry = {
+            'method': method.upper(),
+            'url': final_url,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in HOP_BY_HOP_HEADERS},
+            'body_sha256': body_sha256,
+            'body_length': len(body) if body is not None else None,
+            'partial': partial,
+            'latency': round(latency, 4)
+        }
+        hops = [
+            {
+                'method': method.upper(),
+                'url': hop['url'],
+                'status': hop['status'],
+                'headers': {},
+                'location': next_hop['url'],
+                'latency': round(hop['latency'], 4)
+            }
+            for hop, next_hop in zip(redirects, redirects[1:] + [{'url': final_url}])
+        ]
+
+        with self._lock:
+            for hop in hops:
+                self.records[self._key(method, hop['url'])] = hop
+
+            previous = self.records.get(self._key(method, final_url))
+            if (previous and previous.get('body_sha256') and not previous.get('partial')
+                    and (body is None or partial)):
+                return
+            self.records[self._key(method, final_url)] = entry
+
+    def lookup(self, method: str, url: str) -> Optional[Dict]:
+        """Find a record, letting HEAD requests fall back to a recorded GET."""
+        record = self.records.get(self._key(method, url))
+        if record is None and method.upper() == 'HEAD':
+            record = self.records.get(self._key('GET', url))
+        return record
+
+    def body(self, record: Dict) -> Optional[bytes]:
+        """Return the recorded body for a record, or None if it was not captured."""
+        if not record.get('body_sha256'):
+            return None
+        try:
+            return (self.bodies_dir / record['body_sha256']).read_bytes()
+        except OSError:
+            return None
+
+    def save(self) -> None:
+        """Write the index to disk."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'w') as f:
+                json.dump(self.records, f, indent=2, sort_keys=True)
+        logger.info(f"Saved {len(self.records)} fixtures to {self.directory}")
+
+
+class FixtureServer:
+    """Local stand-in HTTP server that replays a FixtureStore.
+
+    Clients address a recorded URL through ``rewrite(url)``, which maps it to
+    ``http://127.0.0.1:<port>/<quoted url>``; ``unrewrite`` maps response URLs
+    back. Recorded latency is multiplied by ``latency_scale`` and increased
+    by ``extra_latency``; ``error_rate`` is the probability of answering 503
+    instead. A fixed ``seed`` keeps injected errors reproducible.
+    """
+
+    def __init__(self, store: FixtureStore, host: str = '127.0.0.1', port: int = 0,
+                 latency_scale: float = 1.0, extra_latency: float = 0.0,
+                 error_rate: float = 0.0, seed: int = 0):
+        self.store = store
+        self.latency_scale = latency_scale
+        self.extra_latency = extra_latency
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._thread = None
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        bound_host, bound_port = self.httpd.server_address[:2]
+        self.base_url = f"http://{bound_host}:{bound_port}"
+
+    def rewrite(self, url: str) -> str:
+        return f"{self.base_url}/{quote(url, safe='')}"
+
+    def unrewrite(self, url: str) -> str:
+        prefix = self.base_url + '/'
+        return unquote(url[len(prefix):]) if url.startswith(prefix) else url
+
+    def _inject_error(self) -> bool:
+        with self._rng_lock:
+            return self._rng.random() < self.error_rate
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _replay(self, include_body: bool) -> None:
+                url = unquote(self.path.lstrip('/'))
+                record = server.store.lookup(self.command, url)
+
+                if record is None:
+                    self._send(404, {'X-Fixture-Missing': url}, b'', include_body)
+                    return
+
+                time.sleep(record.get('latency', 0) * server.latency_scale + server.extra_latency)
+
+                if server._inject_error():
+                    self._send(503, {'Retry-After': '0', 'X-Fixture-Injected': 'error'}, b'', include_body)
+                    return
+
+                if record.get('location'):
+                    self._send(record['status'], {'Location': server.rewrite(record['location'])},
+                               b'', include_body)
+                    return
+
+                body = server.store.body(record) if include_body else b''
+                if include_body and (body is None or (record.get('partial') and 'Range' not in self.headers)):
+                    # Never stand in an empty or truncated body for a full download
+                    logger.warning(f"No recorded body for GET {url}; answering 404")
+                    self._send(404, {'X-Fixture-Missing-Body': url}, b'', include_body)
+                    return
+
+                self._send(record['status'], record.get('headers', {}), body, include_body)
+
+            def _send(self, status: int, headers: Dict[str, str], body: bytes,
+                      include_body: bool) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if include_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self._replay(include_body=True)
+
+            def do_HEAD(self):
+                self._replay(include_body=False)
+
+            def log_message(self, format, *args):
+                logger.debug(f"fixture server: {format % args}")
+
+        return Handler
+
+    def start(self) -> 'FixtureServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Replaying {len(self.store.records)} fixtures from {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+
+def add_fixture_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --record/--replay options to a script's argument parser."""
+    group = parser.add_argument_group('offline fixtures')
+    group.add_argument('--record', metavar='DIR',
+                       help='Record live HTTP responses into a fixture directory')
+    group.add_argument('--replay', metavar='DIR',
+                       help='Replay responses from a fixture directory instead of the network')
+    group.add_argument('--replay-latency-scale', type=float, default=1.0,
+                       help='Multiply recorded latencies during replay (default: 1.0)')
+    group.add_argument('--replay-extra-latency', type=float, default=0.0,
+                       help='Seconds added to every replayed response (default: 0)')
+    group.add_argument('--replay-error-rate', type=float, default=0.0,
+                       help='Probability of injecting a 503 during replay (default: 0)')
+    group.add_argument('--replay-seed', type=int, default=0,
+                       help='Random seed for error injection (default: 0)')
+
+
+@contextmanager
+def open_fixtures(args: argparse.Namespace) -> Iterator[Tuple[Optional[FixtureStore], Optional[FixtureServer]]]:
+    """Yield ``(recorder, replay_server)`` for parsed fixture arguments."""
+    if args.record and args.replay:
+        raise ValueError("--record and --replay are mutually exclusive")
+
+    recorder = FixtureStore(args.record) if args.record else None
+    server = None
+    if args.replay:
+        server = FixtureServer(
+            FixtureStore(args.replay),
+            latency_scale=args.replay_latency_scale,
+            extra_latency=args.replay_extra_latency,
+            error_rate=args.replay_error_rate,
+            seed=args.replay_seed
+        ).start()
+
+    try:
+        yield recorder, server
+    finally:
+        if recorder:
+            recorder.save()
+        if server:
+            server.stop()
+
+
+def main():
+    """Serve or inspect a fixture directory."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
+    parser = argparse.ArgumentParser(description='Record/replay HTTP fixtures for offline runs')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve = subparsers.add_parser('serve', help='Run the stand-in HTTP server')
+    serve.add_argument('directory', help='Fixture directory')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8800)
+    serve.add_argument('--latency-scale', type=float, default=1.0)
+    serve.add_argument('--extra-latency', type=float, default=0.0)
+    serve.add_argument('--error-rate', type=float, default=0.0)
+    serve.add_argument('--seed', type=int, default=0)
+
+    list_cmd = subparsers.add_parser('list', help='List recorded responses')
+    list_cmd.add_argument('directory', help='Fixture directory')
+
+    args = parser.parse_args()
+    store = FixtureStore(args.directory)
+
+    if args.command == 'list':
+        for key, record in sorted(store.records.items()):
+            print(f"{record['status']}  {record['latency'] * 1000:7.1f}ms  {key}")
+        return
+
+    server = FixtureServer(store, args.host, args.port, args.latency_scale,
+                           args.extra_latency, args.error_rate, args.seed)
+    logger.info(f"Serving fixtures; request {server.rewrite('https://example.org/paper.pdf')}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,668 @@
+#!/usr/bin/env python3
+"""
+Lambda Calculus Papers Archive - Shared Link Checking Engine
+
+Async URL checker used by verify_access.py and scripts/validate-repository.py.
+Each distinct URL is checked at most once per run, through one pooled
+session, with per-host concurrency and spacing, a retry policy for
+transient failures, and a persistent result cache shared between tools.
+Request phases are timed and can be aggregated into per-host latency
+histograms and health scores that persist across runs. Timeouts adapt to
+each host's observed latency, and a per-host circuit breaker skips the
+remaining URLs of a host that keeps failing.
+"""
+
+import json
+import time
+import asyncio
+import ssl
+from bisect import bisect_left
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+import logging
+
+import aiohttp
+import certifi
+
+logger = logging.getLogger(__name__)
+
+# HEAD responses that usually mean "HEAD not supported" rather than a broken URL
+HEAD_UNSUPPORTED_STATUSES = {400, 403, 405, 501}
+PDF_MAGIC = b'%PDF-'
+SNIFF_RANGE = 'bytes=0-1023'
+SNIFF_BYTES = 1024
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_HOST_CONCURRENCY = 2
+DEFAULT_USER_AGENT = 'Lambda Research Archive Verifier (Academic Use)'
+
+# Outcomes worth retrying: transport failures and overloaded servers
+RETRY_STATUSES = {'timeout', 'client_error'}
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Adaptive timeouts: LATENCY_MULTIPLIER times a host's typical latency,
+# bounded by MIN_TIMEOUT and the checker's timeout. Connecting gets at most
+# CONNECT_TIMEOUT seconds, so unreachable hosts fail fast.
+MIN_TIMEOUT = 5
+LATENCY_MULTIPLIER = 4
+CONNECT_TIMEOUT = 10
+
+# A host's circuit opens after FAILURE_THRESHOLD consecutive failed requests;
+# after CIRCUIT_COOLDOWN seconds one trial request is let through again
+FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN = 300
+
+# verification_schedule periods, and the statuses stable enough to cache
+SCHEDULE_PERIODS = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+    'monthly': timedelta(days=30),
+    'quarterly': timedelta(days=91),
+    'yearly': timedelta(days=365)
+}
+DEFAULT_CACHE_TTL = SCHEDULE_PERIODS['weekly']
+CACHEABLE_STATUSES = {
+    'accessible_pdf', 'accessible_html', 'accessible_unknown',
+    'redirect', 'not_found', 'access_denied'
+}
+
+# Timed request phases (milliseconds). aiohttp reports the TLS handshake as
+# part of connection setup, so "connect" covers TCP and TLS.
+TIMING_PHASES = ('dns', 'connect', 'ttfb', 'total')
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# Health score = success EWMA * REF / (REF + latency EWMA): a host that always
+# answers in HEALTH_REFERENCE_MS scores 0.5
+HEALTH_ALPHA = 0.2
+HEALTH_REFERENCE_MS = 1000
+
+
+class HostLimiter:
+    """Caps concurrent requests to one host and spaces out their start times."""
+
+    def __init__(self, concurrency: int, interval: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.interval = interval
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> 'HostLimiter':
+        await self.semaphore.acquire()
+        try:
+            async with self._lock:
+                now = asyncio.get_running_loop().time()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self.interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.semaphore.release()
+
+
+class ResultCache:
+    """Persistent per-URL check results with time-to-live checks."""
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        try:
+            with open(self.cache_file, 'r') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, url: str, ttl: timedelta) -> Optional[Dict]:
+        """Return the cached result for a URL if it is younger than ``ttl``."""
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        try:
+            checked = datetime.fromisoformat(entry['timestamp'])
+        except (KeyError, ValueError):
+            return None
+        return entry if datetime.now() - checked < ttl else None
+
+    def put(self, result: Dict) -> None:
+        """Store a result; transient failures are never cached."""
+        if result.get('status') in CACHEABLE_STATUSES:
+            self.entries[result['url']] = {
+                k: v for k, v in result.items() if k not in ('paper_id', 'cached')
+            }
+
+    def save(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_file, 'w') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+
+def is_host_failure(result: Dict) -> bool:
+    """True if a result says more about the host than the URL (timeouts, 429/5xx)."""
+    return (result.get('status') in RETRY_STATUSES | {'unknown_error'}
+            or result.get('status_code') in RETRY_STATUS_CODES)
+
+
+class HostCircuit:
+    """Adaptive timeout and circuit breaker state for one host during a run."""
+
+    def __init__(self, failure_threshold: int, cooldown: float,
+                 latency_ms: Optional[float] = None):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.latency_ms = latency_ms
+        self.consecutive_failures = 0
+        self.opened_at = None
+
+    def allow(self, now: float) -> bool:
+        """Whether a request may be sent; a cooled-down open circuit admits one trial."""
+        if self.opened_at is None:
+            return True
+        if now - self.opened_at >= self.cooldown:
+            self.opened_at = now
+            return True
+        return False
+
+    def record(self, failed: bool, latency_ms: Optional[float], now: float) -> None:
+        if failed:
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= self.failure_threshold:
+                self.opened_at = now
+            return
+
+        self.consecutive_failures = 0
+        self.opened_at = None
+        if latency_ms is not None:
+            self.latency_ms = (latency_ms if self.latency_ms is None
+                               else self.latency_ms + HEALTH_ALPHA * (latency_ms - self.latency_ms))
+
+    def timeout(self, minimum: float, maximum: float) -> float:
+        """Total timeout in seconds for the next request to this host."""
+        if self.latency_ms is None:
+            return maximum
+        return min(maximum, max(minimum, LATENCY_MULTIPLIER * self.latency_ms / 1000))
+
+
+class HostHealth:
+    """Per-host latency histograms and rolling health scores, persisted across runs.
+
+    Histograms count observations per phase in ``LATENCY_BUCKETS_MS`` bins,
+    the last bin holding everything slower. A request is a failure when it
+    timed out, could not connect, or was answered with 429/5xx.
+    """
+
+    def __init__(self, health_file: Path):
+        self.health_file = Path(health_file)
+        try:
+            with open(self.health_file, 'r') as f:
+                self.hosts = json.load(f)
+        except (OSError, ValueError):
+            self.hosts = {}
+
+    def observe(self, result: Dict) -> None:
+        """Fold one checked result into its host's histograms and score."""
+        host = urlparse(result['url']).netloc
+        entry = self.hosts.setdefault(host, {
+            'requests': 0,
+            'failures': 0,
+            'histograms': {phase: [0] * (len(LATENCY_BUCKETS_MS) + 1) for phase in TIMING_PHASES},
+            'success_ewma': None,
+            'latency_ewma_ms': None,
+            'score': 1.0
+        })
+
+        failed = is_host_failure(result)
+        entry['requests'] += 1
+        entry['failures'] += int(failed)
+
+        timings = result.get('timings') or {}
+        for phase in TIMING_PHASES:
+            if timings.get(phase) is not None:
+                entry['histograms'][phase][bisect_left(LATENCY_BUCKETS_MS, timings[phase])] += 1
+
+        entry['success_ewma'] = self._ewma(entry['success_ewma'], 0.0 if failed else 1.0)
+        if timings.get('total') is not None:
+            entry['latency_ewma_ms'] = self._ewma(entry['latency_ewma_ms'], timings['total'])
+
+        latency = entry['latency_ewma_ms'] or 0.0
+        entry['score'] = round(entry['success_ewma'] * HEALTH_REFERENCE_MS / (HEALTH_REFERENCE_MS + latency), 4)
+        entry['updated'] = result.get('timestamp') or datetime.now().isoformat()
+
+    @staticmethod
+    def _ewma(previous: Optional[float], value: float) -> float:
+        return value if previous is None else round(previous + HEALTH_ALPHA * (value - previous), 4)
+
+    def score(self, host: str) -> Optional[float]:
+        """Stored health score of a host, or None if it was never checked."""
+        entry = self.hosts.get(host)
+        return entry['score'] if entry else None
+
+    def save(self) -> None:
+        self.health_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.health_file, 'w') as f:
+            json.dump(self.hosts, f, indent=2, sort_keys=True)
+
+
+def _elapsed_ms(start: Optional[float], end: float) -> Optional[float]:
+    return round((end - start) * 1000, 1) if start is not None else None
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Trace hooks that fill the ``timings`` dict passed as ``trace_request_ctx``."""
+    trace_config = aiohttp.TraceConfig()
+
+    def timings(ctx) -> Dict:
+        return ctx.trace_request_ctx if isinstance(ctx.trace_request_ctx, dict) else {}
+
+    async def on_request_start(session, ctx, params):
+        ctx.request_start = asyncio.get_running_loop().time()
+
+    async def on_dns_resolvehost_start(session, ctx, params):
+        ctx.dns_start = asyncio.get_running_loop().time()
+
+    async def on_dns_resolvehost_end(session, ctx, params):
+        record = timings(ctx)
+        elapsed = _elapsed_ms(getattr(ctx, 'dns_start', None), asyncio.get_running_loop().time())
+        if elapsed is not None:
+            record['dns'] = round((record.get('dns') or 0) + elapsed, 1)
+            ctx.dns_total = getattr(ctx, 'dns_total', 0) + elapsed
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_start = asyncio.get_running_loop().time()
+        ctx.dns_total = 0
+
+    async def on_connection_create_end(session, ctx, params):
+        record = timings(ctx)
+        elapsed = _elapsed_ms(getattr(ctx, 'connect_start', None), asyncio.get_running_loop().time())
+        if elapsed is not None:
+            # DNS resolution happens inside connection setup; report it separately
+            elapsed = max(0.0, elapsed - getattr(ctx, 'dns_total', 0))
+            record['connect'] = round((record.get('connect') or 0) + elapsed, 1)
+
+    async def on_request_redirect(session, ctx, params):
+        # Time spent on each redirect hop, popped again by _probe
+        now = asyncio.get_running_loop().time()
+        hop_start = getattr(ctx, 'hop_start', getattr(ctx, 'request_start', None))
+        timings(ctx).setdefault('redirects', []).append(_elapsed_ms(hop_start, now))
+        ctx.hop_start = now
+
+    async def on_request_end(session, ctx, params):
+        # Headers of the final response have arrived
+        record = timings(ctx)
+        if record.get('ttfb') is None:
+            record['ttfb'] = _elapsed_ms(getattr(ctx, 'request_start', None), asyncio.get_running_loop().time())
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_redirect.append(on_request_redirect)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+class LinkChecker:
+    """Checks URLs concurrently under per-host limits, retries and a shared cache.
+
+    ``policies`` uses the ``download_policies`` layout of
+    download_sources.json: ``rate_limiting`` (seconds between request starts
+    per host), ``host_concurrency`` (requests in flight per host),
+    ``retry_policy`` (``max_retries`` attempts, ``backoff_factor``),
+    ``circuit_breaker`` (``failure_threshold``, ``cooldown`` seconds) and
+    ``user_agent``. ``timeout`` is the longest a request may take; hosts that
+    answer quickly get shorter timeouts. Every request attempt is folded into
+    ``health`` when a ``HostHealth`` is given.
+    """
+
+    def __init__(self, policies: Optional[Dict] = None, max_concurrent: int = 5,
+                 cache: Optional[ResultCache] = None, politeness_scale: float = 1.0,
+                 timeout: float = DEFAULT_TIMEOUT, health: Optional[HostHealth] = None):
+        policies = policies or {}
+        retry_policy = policies.get('retry_policy', {})
+        circuit_breaker = policies.get('circuit_breaker', {})
+
+        self.max_concurrent = max_concurrent
+        self.rate_limits = policies.get('rate_limiting', {})
+        self.host_concurrency = policies.get('host_concurrency', {})
+        self.max_attempts = max(1, retry_policy.get('max_retries', 3))
+        self.backoff_factor = retry_policy.get('backoff_factor', 2)
+        self.failure_threshold = max(1, circuit_breaker.get('failure_threshold', FAILURE_THRESHOLD))
+        self.circuit_cooldown = circuit_breaker.get('cooldown', CIRCUIT_COOLDOWN)
+        self.user_agent = policies.get('user_agent', DEFAULT_USER_AGENT)
+        self.politeness_scale = politeness_scale
+        self.timeout = timeout
+        self.cache = cache
+        self.health = health
+        self.host_limiters = {}
+        self.host_circuits = {}
+
+        # SSL context for HTTPS requests
+        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+        # Offline fixtures (see http_fixtures.py): a FixtureStore to record
+        # into, or a FixtureServer to replay from
+        self.recorder = None
+        self.replay = None
+
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by every check in a run."""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            ssl=self.ssl_context
+        )
+        return aiohttp.ClientSession(connector=connector, headers={'User-Agent': self.user_agent},
+                                     trace_configs=[create_trace_config()])
+
+    def host_limiter(self, host: str) -> HostLimiter:
+        """Return the limiter for a host, creating it from the configured policies."""
+        if host not in self.host_limiters:
+            interval = self.rate_limits.get(host, self.rate_limits.get('general', 5))
+            concurrency = self.host_concurrency.get(
+                host, self.host_concurrency.get('general', DEFAULT_HOST_CONCURRENCY)
+            )
+            self.host_limiters[host] = HostLimiter(max(1, concurrency), interval * self.politeness_scale)
+        return self.host_limiters[host]
+
+    def host_circuit(self, host: str) -> HostCircuit:
+        """Return the circuit for a host, seeding its latency from the stored health data."""
+        if host not in self.host_circuits:
+            entry = self.health.hosts.get(host) if self.health else None
+            self.host_circuits[host] = HostCircuit(
+                self.failure_threshold,
+                self.circuit_cooldown,
+                entry.get('latency_ewma_ms') if entry else None
+            )
+        return self.host_circuits[host]
+
+    @staticmethod
+    def interleave_by_host(urls: List[str]) -> List[str]:
+        """Round-robin URLs across hosts so no single host monopolises the workers."""
+        by_host = defaultdict(deque)
+        for url in urls:
+            by_host[urlparse(url).netloc].append(url)
+
+        interleaved = []
+        lanes = deque(by_host.values())
+        while lanes:
+            lane = lanes.popleft()
+            interleaved.append(lane.popleft())
+            if lane:
+                lanes.append(lane)
+        return interleaved
+
+    async def _probe(self, session: aiohttp.ClientSession, method: str, url: str,
+                     timeout: aiohttp.ClientTimeout, timings: Optional[Dict] = None) -> Dict:
+        """Issue a HEAD, or a ranged GET that reads only the first chunk of the body.
+
+        Phase timings are accumulated into ``timings`` by the session's trace hooks.
+        """
+        request_url = self.replay.rewrite(url) if self.replay else url
+        headers = {'Range': SNIFF_RANGE} if method == 'GET' else None
+        start_time = time.perf_counter()
+
+        async with session.request(method, request_url, headers=headers, timeout=timeout,
+                                   allow_redirects=True, trace_request_ctx=timings) as response:
+            first_chunk = await response.content.read(SNIFF_BYTES) if method == 'GET' else b''
+            hop_ms = timings.pop('redirects', []) if timings is not None else []
+
+            final_url = str(response.url)
+            if self.replay:
+                final_url = self.replay.unrewrite(final_url)
+
+            # Every hop (requested URL and the status it answered with), ending
+            # with the final URL
+            hops = [(str(hop.url), hop.status) for hop in response.history]
+            redirect_chain = [
+                {'url': self.replay.unrewrite(hop_url) if self.replay else hop_url, 'status': status}
+                for hop_url, status in hops
+            ]
+            if redirect_chain:
+                redirect_chain.append({'url': final_url, 'status': response.status})
+
+            if self.recorder:
+                # The sniffed bytes are a partial body, replayed only to Range requests
+                redirects = [
+                    {'url': hop['url'], 'status': hop['status'], 'latency': (ms or 0.0) / 1000}
+                    for hop, ms in zip(redirect_chain, hop_ms)
+                ]
+                self.recorder.record(
+                    method, url, response.status, dict(response.headers),
+                    first_chunk if method == 'GET' else None,
+                    max(0.0, time.perf_counter() - start_time - sum(hop['latency'] for hop in redirects)),
+                    final_url, redirects, partial=method == 'GET'
+                )
+
+            # A 206 reports the full size in Content-Range ("bytes 0-1023/12345")
+            content_length = response.headers.get('content-length')
+            content_range = response.headers.get('content-range', '')
+            if response.status == 206 and '/' in content_range:
+                content_length = content_range.rsplit('/', 1)[1]
+
+            return {
+                'method': method,
+                'status': 200 if response.status == 206 else response.status,
+                'content_type': response.headers.get('content-type', ''),
+                'content_length': content_length,
+                'final_url': final_url,
+                'redirect_chain': redirect_chain,
+                'pdf_magic': first_chunk.startswith(PDF_MAGIC) if method == 'GET' else None
+            }
+
+    @staticmethod
+    def _new_result(url: str) -> Dict:
+        return {
+            'url': url,
+            'status': 'unknown',
+            'status_code': None,
+            'content_type': None,
+            'content_length': None,
+            'redirect_url': None,
+            'redirect_chain': [],
+            'method': None,
+            'pdf_magic': None,
+            'error': None,
+            'timings': {phase: None for phase in TIMING_PHASES},
+            'timestamp': datetime.now().isoformat()
+        }
+
+    async def check(self, session: aiohttp.ClientSession, url: str,
+                    timeout: Optional[float] = None) -> Dict:
+        """Check a single URL once, giving up after ``timeout`` seconds.
+
+        Probes with HEAD and falls back to a GET for the first 1KB only when
+        HEAD is unsupported or its content type is inconclusive, so a run
+        never transfers whole PDFs.
+        """
+        result = self._new_result(url)
+        timeout = timeout or self.timeout
+        start_time = time.perf_counter()
+
+        try:
+            timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=min(timeout, CONNECT_TIMEOUT))
+            probe = await self._probe(session, 'HEAD', url, timeout, result['timings'])
+
+            inconclusive = (probe['status'] == 200
+                            and not any(t in probe['content_type'].lower() for t in ('pdf', 'html')))
+            if probe['status'] in HEAD_UNSUPPORTED_STATUSES or inconclusive:
+                probe = await self._probe(session, 'GET', url, timeout, result['timings'])
+
+            result['method'] = probe['method']
+            result['pdf_magic'] = probe['pdf_magic']
+            result['status_code'] = probe['status']
+            result['content_type'] = probe['content_type']
+            result['content_length'] = probe['content_length']
+
+            # Check for redirects
+            if probe['final_url'] != url:
+                result['redirect_url'] = probe['final_url']
+                result['redirect_chain'] = probe['redirect_chain']
+
+            if probe['status'] == 200:
+                # Check if it's actually a PDF
+                content_type = result['content_type'].lower()
+                if 'pdf' in content_type or probe['pdf_magic']:
+                    result['status'] = 'accessible_pdf'
+                elif 'html' in content_type:
+                    # Might be a page with PDF link
+                    result['status'] = 'accessible_html'
+                else:
+                    result['status'] = 'accessible_unknown'
+            elif probe['status'] in [301, 302, 303, 307, 308]:
+                result['status'] = 'redirect'
+            elif probe['status'] == 404:
+                result['status'] = 'not_found'
+            elif probe['status'] in [403, 401]:
+                result['status'] = 'access_denied'
+            else:
+                result['status'] = 'error'
+
+        except asyncio.TimeoutError:
+            result['status'] = 'timeout'
+            result['error'] = f"Request timeout ({timeout.total:.0f}s)"
+        except aiohttp.ClientError as e:
+            result['status'] = 'client_error'
+            result['error'] = str(e)
+        except Exception as e:
+            result['status'] = 'unknown_error'
+            result['error'] = str(e)
+
+        result['timings'].pop('redirects', None)  # left behind by a failed probe
+        result['timings']['total'] = round((time.perf_counter() - start_time) * 1000, 1)
+        return result
+
+    def _short_circuit(self, url: str, circuit: HostCircuit) -> Dict:
+        """Result for a URL skipped because its host's circuit is open."""
+        result = self._new_result(url)
+        result['status'] = 'circuit_open'
+        result['error'] = (f"Skipped: {urlparse(url).netloc} failed "
+                           f"{circuit.consecutive_failures} consecutive requests")
+        return result
+
+    async def check_with_retry(self, session: aiohttp.ClientSession, url: str) -> Dict:
+        """Check a URL under its host limiter and circuit, retrying transient failures.
+
+        Once the host's circuit is open, the URL is skipped without a request
+        (status ``circuit_open``) or, mid-retry, keeps its last real result.
+        """
+        host = urlparse(url).netloc
+        limiter = self.host_limiter(host)
+        circuit = self.host_circuit(host)
+        loop = asyncio.get_running_loop()
+        result = None
+        attempts = 0
+
+        for attempt in range(self.max_attempts):
+            if not circuit.allow(loop.time()):
+                break
+            trial = circuit.opened_at is not None
+
+            async with limiter:
+                # The circuit may have opened while this request waited for the host
+                if circuit.opened_at is not None and not trial:
+                    break
+                result = await self.check(session, url, circuit.timeout(MIN_TIMEOUT, self.timeout))
+            attempts += 1
+
+            was_open = circuit.opened_at is not None
+            circuit.record(is_host_failure(result), result['timings']['total'], loop.time())
+            if circuit.opened_at is not None and not was_open:
+                logger.warning(f"Circuit open for {host} after {circuit.consecutive_failures} "
+                               f"consecutive failures; skipping its remaining URLs")
+            if self.health:
+                self.health.observe(result)
+
+            transient = (result['status'] in RETRY_STATUSES
+                         or result['status_code'] in RETRY_STATUS_CODES)
+            if not transient or attempt == self.max_attempts - 1:
+                break
+
+            sleep_time = self.backoff_factor ** attempt
+            logger.info(f"Retrying {url} in {sleep_time}s ({result['error'] or result['status_code']})")
+            await asyncio.sleep(sleep_time)
+
+        if result is None:
+            result = self._short_circuit(url, circuit)
+        result['attempts'] = attempts
+        return result
+
+    async def check_many(self, urls: Iterable[str], ttls: Optional[Dict[str, timedelta]] = None,
+                         on_result: Optional[Callable[[Dict], None]] = None) -> Dict[str, Dict]:
+        """Check each distinct URL once, reusing fresh cache entries.
+
+        A producer feeds a bounded queue drained by ``max_concurrent``
+        workers through one session. ``ttls`` gives per-URL cache lifetimes
+        (default ``DEFAULT_CACHE_TTL``). ``on_result`` is called as soon as
+        each result is known, cached ones (flagged ``cached``) first.
+        """
+        ttls = ttls or {}
+        results = {}
+        stale = []
+
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url, ttls.get(url, DEFAULT_CACHE_TTL)) if self.cache else None
+            if cached:
+                results[url] = {**cached, 'cached': True}
+                if on_result:
+                    on_result(results[url])
+            else:
+                stale.append(url)
+
+        if self.cache:
+            logger.info(f"Using {len(results)} cached results; checking {len(stale)} stale URLs")
+
+        queue = asyncio.Queue(maxsize=self.max_concurrent * 2)
+        total = len(stale)
+        finished = 0
+
+        async def producer() -> None:
+            for url in self.interleave_by_host(stale):
+                await queue.put(url)
+            for _ in range(self.max_concurrent):
+                await queue.put(None)
+
+        async def worker(session: aiohttp.ClientSession) -> None:
+            nonlocal finished
+            while True:
+                url = await queue.get()
+                if url is None:
+                    return
+                try:
+                    result = await self.check_with_retry(session, url)
+                except Exception as e:
+                    logger.error(f"Task failed with exception: {e}")
+                    continue
+
+                # Results are published as they finish, not when the run ends
+                results[url] = result
+                if self.cache:
+                    self.cache.put(result)
+                if on_result:
+                    on_result(result)
+                finished += 1
+                logger.info(f"[{finished}/{total}] {result['status']}: {url}")
+
+        try:
+            if stale:
+                async with self.create_session() as session:
+                    await asyncio.gather(
+                        producer(),
+                        *(worker(session) for _ in range(self.max_concurrent))
+                    )
+        finally:
+            if self.cache:
+                self.cache.save()
+            if self.health:
+                self.health.save()
+
+        return results
+
+    def run(self, urls: Iterable[str], ttls: Optional[Dict[str, timedelta]] = None,
+            on_result: Optional[Callable[[Dict], None]] = None) -> Dict[str, Dict]:
+        """Blocking wrapper around ``check_many`` for synchronous callers."""
+        return asyncio.run(self.check_many(urls, ttls, on_result))
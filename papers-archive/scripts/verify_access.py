@@ -8,14 +8,18 @@ Helps maintain the integrity of download sources.
 
 import json
 import asyncio
-import aiohttp
 import argparse
+from collections import defaultdict
+from statistics import median
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import Dict, List, Optional, Tuple
 import logging
-from datetime import datetime
-import ssl
-import certifi
+from datetime import datetime, timedelta
+
+from http_fixtures import add_fixture_arguments, open_fixtures
+from link_checker import (DEFAULT_CACHE_TTL, SCHEDULE_PERIODS, TIMING_PHASES, HostHealth,
+                          LinkChecker, ResultCache)
 
 # Configure logging
 logging.basicConfig(
@@ -24,10 +28,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+PERMANENT_REDIRECT_STATUSES = {301, 308}
+# Hosts scoring below this are reported as slow or unreliable
+UNHEALTHY_SCORE = 0.5
+# Config sections of author pages and collections, verified alongside papers
+AUXILIARY_SECTIONS = ('author_repositories', 'institutional_sources')
+
+
 class AccessVerifier:
-    """Verifies URL accessibility and open access status."""
+    """Verifies URL accessibility and open access status.
 
-    def __init__(self, config_file: str, max_concurrent: int = 5):
+    URL checks go through the shared ``LinkChecker`` engine; this class maps
+    papers onto URLs and handles streaming, resuming and analysis.
+    """
+
+    def __init__(self, config_file: str, max_concurrent: int = 5,
+                 politeness_scale: float = 1.0, cache_file: Optional[str] = None,
+                 max_age: Optional[timedelta] = None, stream_file: Optional[str] = None,
+                 resume: bool = False, health_file: Optional[str] = None):
         self.config_file = Path(config_file)
         self.max_concurrent = max_concurrent
 
@@ -35,126 +53,175 @@ class AccessVerifier:
         with open(self.config_file, 'r') as f:
             self.config = json.load(f)
 
-        # SSL context for HTTPS requests
-        self.ssl_context = ssl.create_default_context(cafile=certifi.where())
+        # Per-host politeness, retries, the result cache and host health
+        # tracking live in the engine
+        self.checker = LinkChecker(
+            self.config.get('download_policies', {}),
+            max_concurrent,
+            cache=ResultCache(cache_file) if cache_file else None,
+            politeness_scale=politeness_scale,
+            health=HostHealth(health_file) if health_file else None
+        )
+
+        # Incremental runs: only URLs older than their TTL are re-checked
+        self.max_age = max_age
+        self.verification_schedule = self.config.get('verification_schedule', {})
+
+        # Crash-safe JSONL output: one line per finished check, optionally
+        # resuming from the lines an interrupted run already wrote
+        self.stream_file = Path(stream_file) if stream_file else None
+        self.resumed = self.load_partial_results(self.stream_file) if resume and stream_file else {}
+        self._stream = None
 
         # Results storage
         self.verification_results = {}
 
-    async def check_url(self, session: aiohttp.ClientSession, url: str,
-                       paper_id: str) -> Dict:
-        """Check a single URL for accessibility."""
-        result = {
-            'paper_id': paper_id,
-            'url': url,
-            'status': 'unknown',
-            'status_code': None,
-            'content_type': None,
-            'content_length': None,
-            'redirect_url': None,
-            'error': None,
-            'timestamp': datetime.now().isoformat()
-        }
-
+    def _cache_ttl(self, paper_info: Dict) -> timedelta:
+        """TTL for a paper from verification_schedule (or the --max-age override).
+
+        The schedule is keyed by ``<priority>_priority`` and may also name
+        access types (e.g. ``"AR": "daily"``); the shortest matching period wins.
+        """
+        if self.max_age is not None:
+            return self.max_age
+
+        keys = [f"{paper_info.get('download_priority')}_priority", paper_info.get('access_type')]
+        periods = [
+            SCHEDULE_PERIODS[self.verification_schedule[key]]
+            for key in keys
+            if self.verification_schedule.get(key) in SCHEDULE_PERIODS
+        ]
+        return min(periods) if periods else DEFAULT_CACHE_TTL
+
+    @staticmethod
+    def load_partial_results(stream_file: Path) -> Dict[Tuple[str, str, str], Dict]:
+        """Read results from a JSONL stream, keyed by (category, paper_id, url).
+
+        A truncated final line from an interrupted run is ignored.
+        """
+        partial = {}
         try:
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with session.get(url, timeout=timeout, allow_redirects=True) as response:
-                result['status_code'] = response.status
-                result['content_type'] = response.headers.get('content-type', '')
-                result['content_length'] = response.headers.get('content-length')
-
-                # Check for redirects
-                if str(response.url) != url:
-                    result['redirect_url'] = str(response.url)
-
-                if response.status == 200:
-                    # Check if it's actually a PDF
-                    content_type = result['content_type'].lower()
-                    if 'pdf' in content_type:
-                        result['status'] = 'accessible_pdf'
-                    elif 'html' in content_type:
-                        # Might be a page with PDF link
-                        result['status'] = 'accessible_html'
-                    else:
-                        result['status'] = 'accessible_unknown'
-                elif response.status in [301, 302, 303, 307, 308]:
-                    result['status'] = 'redirect'
-                elif response.status == 404:
-                    result['status'] = 'not_found'
-                elif response.status in [403, 401]:
-                    result['status'] = 'access_denied'
-                else:
-                    result['status'] = 'error'
+            with open(stream_file, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    category = record.pop('category', None)
+                    partial[(category, record.get('paper_id'), record.get('url'))] = record
+        except OSError:
+            return {}
+
+        logger.info(f"Resuming with {len(partial)} results from {stream_file}")
+        return partial
+
+    def _emit(self, category: str, result: Dict) -> None:
+        """Publish a finished result to the JSONL stream."""
+        if self._stream:
+            self._stream.write(json.dumps({'category': category, **result}) + '\n')
+            self._stream.flush()
+
+    async def _verify_sources(self, sources: Dict[str, Dict]) -> Dict[str, List[Dict]]:
+        """Verify papers from any number of categories in one engine run.
+
+        Each distinct URL is checked once even when several papers share it;
+        its result is fanned out to every referencing paper as soon as it
+        finishes. Results keep the order of the input papers.
+        """
+        slots = {category: [] for category in sources}
+        references = defaultdict(list)
+        ttls = {}
+
+        for category, papers in sources.items():
+            for paper_id, paper_info in papers.items():
+                url = paper_info.get('url')
+                if not url:
+                    continue
 
-        except asyncio.TimeoutError:
-            result['status'] = 'timeout'
-            result['error'] = 'Request timeout'
-        except aiohttp.ClientError as e:
-            result['status'] = 'client_error'
-            result['error'] = str(e)
-        except Exception as e:
-            result['status'] = 'unknown_error'
-            result['error'] = str(e)
+                resumed = self.resumed.get((category, paper_id, url))
+                if resumed:
+                    slots[category].append(resumed)
+                    continue
 
-        return result
+                slots[category].append(None)
+                references[url].append((category, len(slots[category]) - 1, paper_id))
+                # A URL shared by several papers is re-checked on the shortest schedule
+                ttl = self._cache_ttl(paper_info)
+                ttls[url] = min(ttls.get(url, ttl), ttl)
+
+        def fan_out(result: Dict) -> None:
+            for category, index, paper_id in references[result['url']]:
+                paper_result = {'paper_id': paper_id, **result}
+                slots[category][index] = paper_result
+                self._emit(category, paper_result)
+
+        if self.stream_file:
+            # Appending keeps the lines being resumed from, minus any line an
+            # interrupted run left half-written
+            self._stream = open(self.stream_file, 'a+' if self.resumed else 'w')
+            if self.resumed:
+                self._stream.seek(0)
+                content = self._stream.read()
+                if content and not content.endswith('\n'):
+                    self._stream.truncate(content.rfind('\n') + 1)
+
+        try:
+            await self.checker.check_many(references, ttls, fan_out)
+        finally:
+            if self._stream:
+                self._stream.close()
+                self._stream = None
+
+        return {
+            category: [result for result in category_slots if result is not None]
+            for category, category_slots in slots.items()
+        }
 
     async def verify_category(self, category: str, papers: Dict) -> List[Dict]:
         """Verify all URLs in a category."""
         logger.info(f"Verifying {len(papers)} papers in category: {category}")
+        results = await self._verify_sources({category: papers})
+        return results[category]
 
-        connector = aiohttp.TCPConnector(
-            limit=self.max_concurrent,
-            ssl=self.ssl_context
-        )
+    def collect_sources(self, priorities: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Every checkable entry in the config, grouped by category.
 
-        headers = {
-            'User-Agent': self.config.get('download_policies', {}).get(
-                'user_agent',
-                'Lambda Research Archive Verifier (Academic Use)'
-            )
-        }
-
-        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
-            tasks = []
-
-            for paper_id, paper_info in papers.items():
-                url = paper_info.get('url')
-                if url:
-                    task = self.check_url(session, url, paper_id)
-                    tasks.append(task)
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Filter out exceptions and convert to proper results
-            valid_results = []
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Task failed with exception: {result}")
-                else:
-                    valid_results.append(result)
+        Papers come from ``download_sources``. Each URL field of an
+        ``author_repositories`` or ``institutional_sources`` entry becomes an
+        entry of its own, keyed ``<entry>.<field>``. Those sections have no
+        priorities, so they are left out when ``priorities`` is given.
+        """
+        sources = {}
 
-            return valid_results
-
-    async def verify_all_sources(self, priorities: Optional[List[str]] = None) -> Dict:
-        """Verify all download sources."""
-        download_sources = self.config.get('download_sources', {})
-        all_results = {}
-
-        for category, papers in download_sources.items():
+        for category, papers in self.config.get('download_sources', {}).items():
             # Filter by priority if specified
             if priorities:
-                filtered_papers = {
+                papers = {
                     pid: pinfo for pid, pinfo in papers.items()
                     if pinfo.get('download_priority') in priorities
                 }
-                if not filtered_papers:
-                    continue
-                papers = filtered_papers
+            if papers:
+                sources[category] = papers
+
+        if not priorities:
+            for section in AUXILIARY_SECTIONS:
+                entries = {
+                    f"{entry_id}.{field}": {'url': value, 'section': section, 'field': field}
+                    for entry_id, entry in self.config.get(section, {}).items()
+                    for field, value in entry.items()
+                    if isinstance(value, str) and value.startswith(('http://', 'https://'))
+                }
+                if entries:
+                    sources[section] = entries
 
-            category_results = await self.verify_category(category, papers)
-            all_results[category] = category_results
+        return sources
 
-        return all_results
+    async def verify_all_sources(self, priorities: Optional[List[str]] = None) -> Dict:
+        """Verify every section of the config with a single deduplicated URL set."""
+        sources = self.collect_sources(priorities)
+        for category, papers in sources.items():
+            logger.info(f"Verifying {len(papers)} entries in category: {category}")
+        return await self._verify_sources(sources)
 
     def analyze_results(self, results: Dict) -> Dict:
         """Analyze verification results and generate summary."""
@@ -167,12 +234,17 @@ class AccessVerifier:
                 'redirect': 0,
                 'access_denied': 0,
                 'timeout': 0,
+                'not_checked': 0,
                 'error': 0
             },
             'by_category': {},
             'issues': [],
+            'redirects': [],
+            'hosts': {},
             'recommendations': []
         }
+        host_timings = defaultdict(lambda: defaultdict(list))
+        timed_urls = set()
 
         for category, category_results in results.items():
             category_summary = {
@@ -223,6 +295,15 @@ class AccessVerifier:
                         'issue': 'Request timeout',
                         'url': result['url']
                     })
+                elif status == 'circuit_open':
+                    # Never requested: the host's circuit breaker was open
+                    analysis['summary']['not_checked'] += 1
+                    category_summary['issues'].append({
+                        'paper_id': result['paper_id'],
+                        'issue': 'Not checked (host circuit open)',
+                        'url': result['url'],
+                        'error': result.get('error')
+                    })
                 else:
                     analysis['summary']['error'] += 1
                     category_summary['issues'].append({
@@ -232,9 +313,31 @@ class AccessVerifier:
                         'error': result.get('error', 'Unknown error')
                     })
 
-                # Check for non-PDF content types
-                content_type = result.get('content_type', '').lower()
-                if result.get('status_code') == 200 and 'pdf' not in content_type:
+                # Phase timings of URLs checked in this run, once per URL
+                if not result.get('cached') and result['url'] not in timed_urls:
+                    timed_urls.add(result['url'])
+                    host = urlparse(result['url']).netloc
+                    for phase, ms in (result.get('timings') or {}).items():
+                        if ms is not None:
+                            host_timings[host][phase].append(ms)
+
+                # Followed redirects, with the full hop list. A redirect_url
+                # without a chain is only the normalised request URL
+                if result.get('redirect_chain') and status.startswith('accessible'):
+                    analysis['redirects'].append({
+                        'category': category,
+                        'paper_id': result['paper_id'],
+                        'url': result['url'],
+                        'final_url': result['redirect_url'],
+                        'hops': len(result['redirect_chain']) - 1,
+                        'permanent': self._is_permanent_redirect(result)
+                    })
+
+                # Check for non-PDF content types (author pages and collections are HTML)
+                content_type = (result.get('content_type') or '').lower()
+                if (category not in AUXILIARY_SECTIONS
+                        and result.get('status_code') == 200 and 'pdf' not in content_type
+                        and not result.get('pdf_magic')):
                     category_summary['issues'].append({
                         'paper_id': result['paper_id'],
                         'issue': f'Non-PDF content type: {content_type}',
@@ -250,6 +353,8 @@ class AccessVerifier:
                     **issue
                 })
 
+        analysis['hosts'] = self._host_latency(host_timings)
+
         # Generate recommendations
         total_urls = analysis['summary']['total_urls']
         broken_pct = (analysis['summary']['broken'] / total_urls * 100) if total_urls > 0 else 0
@@ -264,13 +369,92 @@ class AccessVerifier:
                 "Some URLs deny access. Check if papers moved or access policies changed."
             )
 
+        if analysis['summary']['not_checked'] > 0:
+            analysis['recommendations'].append(
+                f"{analysis['summary']['not_checked']} URLs were skipped because their host kept failing. "
+                f"Re-run later to check them."
+            )
+
         if analysis['summary']['timeout'] > 2:
             analysis['recommendations'].append(
                 "Multiple timeouts detected. Consider increasing timeout or checking network."
             )
 
+        permanent = sum(1 for r in analysis['redirects'] if r['permanent'])
+        if permanent:
+            analysis['recommendations'].append(
+                f"{permanent} URLs permanently redirect. Run with --rewrite-canonical "
+                f"to store their final URLs."
+            )
+
+        unhealthy = [host for host, stats in analysis['hosts'].items()
+                     if stats['health_score'] is not None and stats['health_score'] < UNHEALTHY_SCORE]
+        if unhealthy:
+            analysis['recommendations'].append(
+                f"Slow or unreliable hosts (health < {UNHEALTHY_SCORE}): {', '.join(sorted(unhealthy))}. "
+                f"Downloads from them are scheduled last."
+            )
+
         return analysis
 
+    def _host_latency(self, host_timings: Dict[str, Dict[str, List[float]]]) -> Dict[str, Dict]:
+        """Per-host median/p95 of each timed phase, with the persisted histograms and score."""
+        health = self.checker.health
+        hosts = {}
+
+        for host, phases in sorted(host_timings.items()):
+            stats = {'requests': len(phases.get('total', []))}
+            for phase in TIMING_PHASES:
+                samples = sorted(phases.get(phase, []))
+                if samples:
+                    stats[f'{phase}_p50_ms'] = median(samples)
+                    stats[f'{phase}_p95_ms'] = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+
+            stats['health_score'] = health.score(host) if health else None
+            stats['histograms'] = health.hosts.get(host, {}).get('histograms') if health else None
+            hosts[host] = stats
+
+        return hosts
+
+    @staticmethod
+    def _is_permanent_redirect(result: Dict) -> bool:
+        """True if every hop of a result's redirect chain is a 301/308."""
+        chain = result.get('redirect_chain') or []
+        return len(chain) > 1 and all(hop['status'] in PERMANENT_REDIRECT_STATUSES for hop in chain[:-1])
+
+    def rewrite_canonical_urls(self, results: Dict) -> int:
+        """Replace permanently redirected paper URLs with their final URL.
+
+        Only accessible results whose whole chain is 301/308 are rewritten,
+        since temporary redirects often point at session or CDN URLs. The
+        previous URL is kept as ``canonicalized_from`` and the configuration
+        file is saved in place. Returns the number of rewritten URLs.
+        """
+        download_sources = self.config.get('download_sources', {})
+        rewritten = 0
+
+        for category, category_results in results.items():
+            for result in category_results:
+                if not (str(result.get('status')).startswith('accessible')
+                        and self._is_permanent_redirect(result)):
+                    continue
+
+                paper_info = download_sources.get(category, {}).get(result['paper_id'])
+                if not paper_info or paper_info.get('url') != result['url']:
+                    continue
+
+                paper_info['canonicalized_from'] = result['url']
+                paper_info['url'] = result['redirect_url']
+                rewritten += 1
+                logger.info(f"Canonical URL for {result['paper_id']}: {result['redirect_url']}")
+
+        if rewritten:
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            logger.info(f"Rewrote {rewritten} URLs in {self.config_file}")
+
+        return rewritten
+
     def save_results(self, results: Dict, analysis: Dict, output_file: str) -> None:
         """Save verification results to file."""
         output_data = {
@@ -299,8 +483,27 @@ async def main():
                        help='Verify only papers with specific priority')
     parser.add_argument('--concurrent', type=int, default=5,
                        help='Maximum concurrent requests')
+    parser.add_argument('--politeness-scale', type=float, default=1.0,
+                       help='Scale per-host request spacing from rate_limiting (0 disables)')
+    parser.add_argument('--cache',
+                       help='Result cache file (default: verification_cache.json next to the config)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Re-check every URL and do not update the cache')
+    parser.add_argument('--health',
+                       help='Host health file (default: host_health.json next to the config)')
+    parser.add_argument('--no-health', action='store_true',
+                       help='Do not update per-host latency histograms and health scores')
+    parser.add_argument('--rewrite-canonical', action='store_true',
+                       help='Write final URLs of permanent (301/308) redirects back into the config')
+    parser.add_argument('--stream',
+                       help='Write each result as a JSON line as soon as it finishes')
+    parser.add_argument('--resume', action='store_true',
+                       help='Skip checks already present in the --stream file')
+    parser.add_argument('--max-age', type=float,
+                       help='Re-check results older than this many days (overrides verification_schedule)')
     parser.add_argument('--summary-only', action='store_true',
                        help='Show only summary, not detailed results')
+    add_fixture_arguments(parser)
 
     args = parser.parse_args()
 
@@ -322,28 +525,41 @@ async def main():
         logger.error(f"Configuration file not found. Tried: {[str(p) for p in candidate_paths]}")
         return
 
-    verifier = AccessVerifier(config_path, args.concurrent)
+    # Replayed results must not leak into the real cache or host health
+    cache_file = None
+    if not args.no_cache and not args.replay:
+        cache_file = Path(args.cache) if args.cache else config_path.parent / 'verification_cache.json'
+    health_file = None
+    if not args.no_health and not args.replay:
+        health_file = Path(args.health) if args.health else config_path.parent / 'host_health.json'
+    max_age = timedelta(days=args.max_age) if args.max_age is not None else None
+
+    if args.resume and not args.stream:
+        logger.error("--resume requires --stream")
+        return
 
-    # Run verification
-    priorities = [args.priority] if args.priority else None
+    verifier = AccessVerifier(config_path, args.concurrent, args.politeness_scale,
+                              cache_file, max_age, args.stream, args.resume, health_file)
 
-    if args.category:
-        # Verify specific category
-        papers = verifier.config.get('download_sources', {}).get(args.category, {})
-        if priorities:
-            papers = {
-                pid: pinfo for pid, pinfo in papers.items()
-                if pinfo.get('download_priority') in priorities
-            }
+    with open_fixtures(args) as (recorder, replay):
+        verifier.checker.recorder = recorder
+        verifier.checker.replay = replay
 
-        if papers:
-            results = {args.category: await verifier.verify_category(args.category, papers)}
+        # Run verification
+        priorities = [args.priority] if args.priority else None
+
+        if args.category:
+            # Verify specific category
+            papers = verifier.collect_sources(priorities).get(args.category, {})
+
+            if papers:
+                results = {args.category: await verifier.verify_category(args.category, papers)}
+            else:
+                logger.error(f"No papers found in category: {args.category}")
+                return
         else:
-            logger.error(f"No papers found in category: {args.category}")
-            return
-    else:
-        # Verify all sources
-        results = await verifier.verify_all_sources(priorities)
+            # Verify all sources
+            results = await verifier.verify_all_sources(priorities)
 
     # Analyze results
     analysis = verifier.analyze_results(results)
@@ -352,6 +568,9 @@ async def main():
     if args.output:
         verifier.save_results(results, analysis, args.output)
 
+    if args.rewrite_canonical:
+        verifier.rewrite_canonical_urls(results)
+
     # Print summary
     summary = analysis['summary']
     logger.info(f"Verification Summary:")
@@ -361,8 +580,20 @@ async def main():
     logger.info(f"  Redirects: {summary['redirect']}")
     logger.info(f"  Access denied: {summary['access_denied']}")
     logger.info(f"  Timeouts: {summary['timeout']}")
+    logger.info(f"  Not checked (host circuit open): {summary['not_checked']}")
     logger.info(f"  Other errors: {summary['error']}")
 
+    slowest = sorted(
+        ((stats.get('total_p50_ms', 0), host) for host, stats in analysis['hosts'].items()),
+        reverse=True
+    )[:5]
+    if slowest:
+        logger.info(f"Slowest hosts (median total latency):")
+        for latency, host in slowest:
+            score = analysis['hosts'][host]['health_score']
+            score_text = f", health {score:.2f}" if score is not None else ''
+            logger.info(f"  {host}: {latency:.0f} ms{score_text}")
+
     if analysis['issues'] and not args.summary_only:
         logger.warning(f"\nFound {len(analysis['issues'])} issues:")
         for issue in analysis['issues'][:10]:  # Show first 10 issues
@@ -16,12 +16,18 @@ import os
 import re
 import sys
 import json
+import hashlib
+import posixpath
+import unicodedata
 import urllib.request
 import urllib.error
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime
+from typing import List, Dict, Iterator, Set, Tuple, Optional
+from urllib.parse import urlparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime, timedelta
 import time
 
 # Try to import requests for better URL validation
@@ -31,10 +37,528 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+# Shared async link-checking engine from the papers archive (needs aiohttp).
+# Appended, so the archive scripts cannot shadow installed modules
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'papers-archive' / 'scripts'))
+try:
+    from link_checker import LinkChecker, ResultCache
+    HAS_LINK_CHECKER = True
+except ImportError:
+    HAS_LINK_CHECKER = False
+
+# inotify lets --watch sleep until something changes (Linux); elsewhere it polls
+HAS_INOTIFY = False
+if sys.platform.startswith('linux'):
+    try:
+        import ctypes
+        import ctypes.util
+        import select
+        import struct
+        _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        _libc.inotify_init1
+        HAS_INOTIFY = True
+    except (ImportError, OSError, TypeError, AttributeError):
+        HAS_INOTIFY = False
+
+# Documentation links are mostly one-off pages spread over many hosts, so the
+# validator is lighter on politeness than the paper downloader
+LINK_CHECK_POLICIES = {
+    'rate_limiting': {'general': 0.25},
+    'host_concurrency': {'general': 4},
+    'retry_policy': {'max_retries': 2, 'backoff_factor': 2},
+    'circuit_breaker': {'failure_threshold': 3, 'cooldown': 120},
+    'user_agent': 'Mozilla/5.0 (compatible; Repository-Validator/2.0)'
+}
+LINK_CHECK_WORKERS = 8
+LINK_CHECK_TIMEOUT = 10  # upper bound; hosts that answer quickly get less
+DEFAULT_URL_CACHE = Path('papers-archive') / 'metadata' / 'verification_cache.json'
+URL_CACHE_MAX_AGE = timedelta(hours=1)  # reuse cached URL results only within one session
+
+# Per-file checks take tens of microseconds, so a process pool only pays
+# for its start-up and IPC on large trees
+PARALLEL_MIN_FILES = 2000
+
+# Incremental validation: per-file results keyed by content hash
+VALIDATION_CACHE_VERSION = 3
+DEFAULT_VALIDATION_CACHE = Path('.validation-cache.json')
+
+# Structured findings: rule id -> description (SARIF reportingDescriptor)
+FINDING_RULES = {
+    'unreadable-directory': 'A directory could not be listed',
+    'cache-write-failed': 'The incremental validation cache could not be written',
+    'missing-directory': 'An expected topic directory or subdirectory is missing',
+    'empty-markdown': 'A Markdown file is empty',
+    'missing-title': 'A Markdown file does not start with a header',
+    'missing-section': 'A topic index lacks a required section',
+    'read-error': 'A file could not be read or parsed',
+    'broken-link': 'An internal link points to a missing file or outside the repository',
+    'broken-anchor': 'A #fragment matches no heading or anchor of its target',
+    'no-citations': 'A bibliography file has no standard citations',
+    'low-doi-coverage': 'Few bibliography entries carry a DOI',
+    'url-check-error': 'A URL check failed unexpectedly',
+    'broken-url': 'An external URL is unreachable or returns an error',
+    'restricted-url': 'An external URL requires authentication',
+    'unchecked-url': 'An external URL was skipped because its host kept failing'
+}
+FINDINGS_FORMATS = ('jsonl', 'sarif')
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+# Watch mode
+WATCH_POLL_INTERVAL = 1.0  # seconds between scans when inotify is unavailable
+WATCH_DEBOUNCE = 0.3       # quiet period that ends a burst of changes (editor saves)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+# Files count as changed when closed after writing, not on every write
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT = struct.Struct('iIII') if HAS_INOTIFY else None
+
+# Single-pass tokenizer for Markdown links, <autolinks> and raw URLs; the
+# leading lookahead lets the scanner skip positions no token can start at
+LINK_TOKEN_RE = re.compile(
+    r'(?=[\[<h])(?:'
+    r'\[(?P<text>[^\]]+)\]\((?P<link>[^)]+)\)'  # [text](url)
+    r'|<(?P<autolink>https?://[^>]+)>'          # <url>
+    r'|(?:(?<=\s)|\A)(?P<raw>https?://\S+)'     # raw URLs
+    r')'
+)
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+CODE_SPAN_RE = re.compile(r'`.*?`')
+
+# Hosts whose URLs are never checked (local servers and sites that reject
+# automated requests); subdomains are skipped too
+URL_SKIP_DOMAINS = {
+    'localhost', '127.0.0.1', 'doi.org', 'cambridge.org', 'sciencedirect.com',
+    'repository.ubn.ru.nl', 'ics.uci.edu', 'archives-ouvertes.fr'
+}
+# The project's own repositories and pages
+URL_SKIP_SUBSTRINGS = ('Oichkatzelesfrettschen',)
+
+def make_finding(level: str, rule: str, message: str, file: Optional[str] = None,
+                 line: Optional[int] = None, column: Optional[int] = None) -> Dict:
+    """A structured finding; message is the text shown in reports"""
+    return {'level': level, 'rule': rule, 'message': message,
+            'file': file, 'line': line, 'column': column}
+
+def line_column(content: str, offset: int) -> Tuple[int, int]:
+    """1-based (line, column) of an offset into content"""
+    line_start = content.rfind('\n', 0, offset) + 1
+    return content.count('\n', 0, offset) + 1, offset - line_start + 1
+
+def strip_code(content: str) -> Tuple[str, List[Tuple[int, int]]]:
+    """content without code blocks and spans, and how to map offsets back.
+
+    The second value lists (offset, original offset) at the start of each
+    run of kept text; pass it to original_offset.
+    """
+    text, runs = content, [(0, 0)]
+    for pattern in (CODE_BLOCK_RE, CODE_SPAN_RE):
+        starts = [start for start, _ in runs]
+        pieces, kept_runs, pos, out = [], [], 0, 0
+        for end, resume in [(m.start(), m.end()) for m in pattern.finditer(text)] + [(len(text), None)]:
+            if end > pos:
+                # A kept piece may span several runs of the previous pass
+                kept_runs.append((out, original_offset(runs, pos)))
+                for boundary in starts[bisect_right(starts, pos):bisect_left(starts, end)]:
+                    kept_runs.append((out + boundary - pos, original_offset(runs, boundary)))
+                pieces.append(text[pos:end])
+                out += end - pos
+            pos = resume
+        text, runs = ''.join(pieces), kept_runs or [(0, 0)]
+    return text, runs
+
+def original_offset(runs: List[Tuple[int, int]], offset: int) -> int:
+    """Offset in the original content of an offset into strip_code's text"""
+    start, original = runs[bisect_right(runs, (offset, float('inf'))) - 1]
+    return original + offset - start
+
+class FindingStream:
+    """Writes findings to a file as they are found, as JSONL or SARIF 2.1.0.
+
+    JSONL gets one object per line. SARIF results are appended to an open
+    results array and the document is closed by close(), so a run that is
+    still in progress can be tailed but only a finished one parses.
+    """
+
+    def __init__(self, path: str, fmt: str = 'jsonl', root: Optional[Path] = None):
+        self.format = fmt
+        self.count = 0
+        self._file = open(path, 'w', encoding='utf-8')
+        if fmt == 'sarif':
+            driver = {
+                'name': 'validate-repository',
+                'rules': [
+                    {'id': rule, 'shortDescription': {'text': text}}
+                    for rule, text in FINDING_RULES.items()
+                ]
+            }
+            self._file.write(
+                f'{{"$schema": "{SARIF_SCHEMA}", "version": "2.1.0", "runs": [{{'
+                f'"tool": {{"driver": {json.dumps(driver)}}}, '
+                f'"originalUriBaseIds": {{"SRCROOT": {{"uri": "{(root or Path.cwd()).resolve().as_uri()}/"}}}}, '
+                f'"results": [\n'
+            )
+        self._file.flush()
+
+    def write(self, finding: Dict):
+        if self.format == 'sarif':
+            record = self._sarif_result(finding)
+            self._file.write((',\n' if self.count else '') + json.dumps(record))
+        else:
+            self._file.write(json.dumps(finding) + '\n')
+        self._file.flush()
+        self.count += 1
+
+    @staticmethod
+    def _sarif_result(finding: Dict) -> Dict:
+        result = {
+            'ruleId': finding['rule'],
+            'level': finding['level'],
+            'message': {'text': finding['message']}
+        }
+        if finding['file']:
+            location = {'artifactLocation': {'uri': finding['file'], 'uriBaseId': 'SRCROOT'}}
+            if finding['line']:
+                location['region'] = {'startLine': finding['line']}
+                if finding['column']:
+                    location['region']['startColumn'] = finding['column']
+            result['locations'] = [{'physicalLocation': location}]
+        return result
+
+    def close(self, successful: bool = True):
+        if self.format == 'sarif':
+            invocation = {
+                'executionSuccessful': successful,
+                'endTimeUtc': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            }
+            self._file.write(f'\n], "invocations": [{json.dumps(invocation)}]}}]}}\n')
+        self._file.close()
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of values, or None when there are none"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))]
+
+def iter_link_tokens(content: str) -> Iterator[Tuple[str, str, int]]:
+    """Yield (kind, target, offset) for every link, autolink and raw URL.
+
+    kind is 'link', 'autolink' or 'raw'; offset is the position of the
+    target in content.
+    """
+    for match in LINK_TOKEN_RE.finditer(content):
+        kind = match.lastgroup
+        yield kind, match.group(kind), match.start(kind)
+
+# Anchor sources, matching the toc, attr_list and footnotes extensions
+# enabled in mkdocs.yml
+FRONT_MATTER_RE = re.compile(r'\A---[ \t]*\n.*?\n---[ \t]*\n', re.DOTALL)
+HEADING_RE = re.compile(
+    r'^(?:#{1,6}(?P<atx>.*?)#*[ \t]*'                 # ATX: ## Heading ##
+    r'|(?P<setext>[^\s#>|=-].*?)[ \t]*\n(?:=+|-+)[ \t]*)$',  # Setext: Heading\n====
+    re.MULTILINE
+)
+HEADING_ATTRS_RE = re.compile(r'[ \t]*\{:?([^}]*)\}[ \t]*$')
+HTML_ANCHOR_RE = re.compile(r'<[A-Za-z][^>]*?\s(?:id|name)=["\']([^"\']+)["\']')
+FOOTNOTE_RE = re.compile(r'^\[\^([^\]]+)\]:', re.MULTILINE)
+HEADING_COUNT_RE = re.compile(r'^(.*)_([0-9]+)$')
+
+def slugify_heading(text: str) -> str:
+    """Anchor id of a heading, following Python-Markdown's default toc slugify"""
+    value = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[-\s]+', '-', value)
+
+def heading_text(source: str) -> str:
+    """Approximate the rendered text of a heading's Markdown source"""
+    text = re.sub(r'!?\[([^\]]*)\]\([^)]*\)', r'\1', source)  # links and images
+    text = re.sub(r'<[^>]+>', '', text)                         # inline HTML
+    text = re.sub(r'&[#a-zA-Z0-9]+;', '', text)                 # entities
+    return re.sub(r'(?<!\w)(_{1,2})(\S(?:.*?\S)?)\1(?!\w)', r'\2', text)  # _emphasis_
+
+def unique_anchor(anchor: str, used: Set[str]) -> str:
+    """Python-Markdown's toc de-duplication: heading, heading_1, heading_2, ..."""
+    while anchor in used or not anchor:
+        match = HEADING_COUNT_RE.match(anchor)
+        if match:
+            anchor = f"{match.group(1)}_{int(match.group(2)) + 1}"
+        else:
+            anchor = f"{anchor}_1"
+    used.add(anchor)
+    return anchor
+
+def extract_anchors(content: str) -> List[str]:
+    """Every fragment id a rendered Markdown page defines.
+
+    Headings get MkDocs ids: an explicit attr_list {#id}, otherwise the
+    slug of the heading text, suffixed _1, _2, ... when repeated. Raw HTML
+    id/name attributes and footnote ids (fn:x, fnref:x) are included too.
+    """
+    content = CODE_BLOCK_RE.sub('', FRONT_MATTER_RE.sub('', content))
+
+    headings = []
+    explicit = set()
+    for match in HEADING_RE.finditer(content):
+        source = (match.group('atx') if match.group('atx') is not None else match.group('setext')).strip()
+        anchor = None
+        attrs = HEADING_ATTRS_RE.search(source)
+        if attrs:
+            source = source[:attrs.start()]
+            ids = re.findall(r'#([^\s}]+)', attrs.group(1))
+            if ids:
+                anchor = ids[-1]
+                explicit.add(anchor)
+        headings.append((anchor, source))
+
+    used = set(explicit)
+    anchors = [
+        anchor if anchor is not None else unique_anchor(slugify_heading(heading_text(source)), used)
+        for anchor, source in headings
+    ]
+
+    anchors.extend(HTML_ANCHOR_RE.findall(content))
+    for note in FOOTNOTE_RE.findall(content):
+        anchors.extend((f"fn:{note}", f"fnref:{note}"))
+    return anchors
+
+class LinkGraph:
+    """Documents and assets (nodes) and the internal links between them (edges).
+
+    Paths are POSIX strings relative to the repository root. Each edge is
+    (source, target, anchor, link, line, column), where target is None for
+    links that leave the repository, anchor is '' when the link has none and
+    line/column locate the link target in the source.
+    """
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict] = {}
+        self.edges: List[Tuple[str, Optional[str], str, str, int, int]] = []
+        self._outgoing: Dict[str, List[Tuple[str, Optional[str], str, str, int, int]]] = {}
+        self._backlinks: Dict[str, Set[str]] = {}
+
+    def add_node(self, path: str, kind: str, anchors: Optional[List[str]] = None):
+        self.nodes[path] = {'kind': kind, 'anchors': set(anchors or [])}
+
+    def add_edge(self, source: str, target: Optional[str], anchor: str, link: str,
+                 line: int, column: int):
+        edge = (source, target, anchor, link, line, column)
+        self.edges.append(edge)
+        self._outgoing.setdefault(source, []).append(edge)
+        if target is not None:
+            self._backlinks.setdefault(target, set()).add(source)
+
+    def exists(self, path: str) -> bool:
+        return path in self.nodes
+
+    def outgoing(self, source: str) -> List[Tuple[str, Optional[str], str, str, int, int]]:
+        return self._outgoing.get(source, [])
+
+    def backlinks(self, path: str) -> List[str]:
+        """Documents linking to path"""
+        return sorted(self._backlinks.get(path, set()) - {path})
+
+    def orphans(self) -> List[str]:
+        """Documents no other document links to, except README/index entry points"""
+        return sorted(
+            path for path, node in self.nodes.items()
+            if node['kind'] == 'doc' and not self.backlinks(path)
+            and Path(path).name not in ('README.md', 'index.md')
+        )
+
+    def broken_anchors(self) -> List[Tuple[str, Optional[str], str, str, int, int]]:
+        """Edges whose anchor matches no heading of an existing target document"""
+        return [
+            edge for edge in self.edges
+            if edge[2] and edge[1] in self.nodes and self.nodes[edge[1]]['kind'] == 'doc'
+            and edge[2] not in self.nodes[edge[1]]['anchors']
+        ]
+
+    def to_dict(self) -> Dict:
+        return {
+            'nodes': {
+                path: {'kind': node['kind'], 'anchors': sorted(node['anchors'])}
+                for path, node in sorted(self.nodes.items())
+            },
+            'edges': [
+                {'source': source, 'target': target, 'anchor': anchor, 'link': link, 'line': line}
+                for source, target, anchor, link, line, _ in self.edges
+            ],
+            'backlinks': {path: self.backlinks(path) for path in sorted(self._backlinks)},
+            'orphans': self.orphans(),
+            'broken_anchors': [
+                {'source': source, 'target': target, 'anchor': anchor, 'link': link, 'line': line}
+                for source, target, anchor, link, line, _ in self.broken_anchors()
+            ]
+        }
+
+class RepositoryWatcher:
+    """Blocks until files under a directory tree change.
+
+    Uses one inotify watch per directory when available, otherwise polls
+    file mtimes and sizes. Directories named in ignored_dirs are not
+    watched, and changes to ignored_files (the validator's own outputs)
+    are dropped.
+    """
+
+    def __init__(self, root: Path, ignored_dirs: Set[str], ignored_files: Optional[Set[Path]] = None,
+                 poll_interval: float = WATCH_POLL_INTERVAL):
+        self.root = Path(root)
+        self.ignored_dirs = set(ignored_dirs)
+        self.ignored_files = {Path(f).resolve() for f in (ignored_files or ())}
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+        self._watches: Dict[int, Path] = {}
+        self._snapshot: Dict[Path, Tuple[int, int]] = {}
+
+        if HAS_INOTIFY:
+            try:
+                self._start_inotify()
+            except OSError as e:
+                print(f"[WARNING] inotify unavailable ({e}); polling every {poll_interval}s", file=sys.stderr)
+                self.close()
+        if self._fd is None:
+            self._snapshot = self._scan()
+        self.backend = 'inotify' if self._fd is not None else 'polling'
+
+    def _directories(self, top: Path) -> Iterator[Path]:
+        """top and every directory below it, pruning ignored_dirs"""
+        pending = [top]
+        while pending:
+            current = pending.pop()
+            yield current
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name not in self.ignored_dirs and entry.is_dir(follow_symlinks=False):
+                            pending.append(Path(entry.path))
+            except OSError:
+                continue
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime_ns, size) of every watched file, for the polling backend"""
+        snapshot = {}
+        for directory in self._directories(self.root):
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+        return snapshot
+
+    def _start_inotify(self):
+        fd = _libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        for directory in self._directories(self.root):
+            self._add_watch(directory)
+
+    def _add_watch(self, directory: Path):
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"{os.strerror(errno)}: {directory}")
+        self._watches[wd] = directory
+
+    def _read_events(self, timeout: Optional[float]) -> Set[Path]:
+        """Paths named by the inotify events that arrive within timeout"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        data = b''
+        while True:
+            try:
+                chunk = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+            if not chunk:
+                break
+            data += chunk
+
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(data, offset)
+            name = os.fsdecode(data[offset + INOTIFY_EVENT.size:offset + INOTIFY_EVENT.size + length].rstrip(b'\0'))
+            offset += INOTIFY_EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost: report the whole tree as changed
+                changed.add(self.root)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._watches[wd]
+                continue
+            if name in self.ignored_dirs:
+                continue
+
+            path = directory / name if name else directory
+            if path in self.ignored_files:
+                continue
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                for subdirectory in self._directories(path):
+                    try:
+                        self._add_watch(subdirectory)
+                    except OSError:
+                        continue
+            changed.add(path)
+        return changed
+
+    def _poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Paths added, removed or modified since the previous scan"""
+        time.sleep(self.poll_interval if timeout is None else timeout)
+        snapshot = self._scan()
+        changed = {
+            path for path in snapshot.keys() | self._snapshot.keys()
+            if snapshot.get(path) != self._snapshot.get(path)
+        }
+        self._snapshot = snapshot
+        return changed - self.ignored_files
+
+    def wait(self) -> Set[Path]:
+        """Block until something changes, then return every path changed in that burst"""
+        collect = self._read_events if self._fd is not None else self._poll
+        changed = set()
+        while not changed:
+            changed = collect(None)
+        while True:
+            more = collect(WATCH_DEBOUNCE)
+            if not more:
+                return changed
+            changed |= more
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+
 class RepositoryValidator:
     def __init__(self, root_path: str, strict: bool = False, verbose: bool = False, 
-                 check_mode: str = 'all', report_format: str = 'text'):
+                 check_mode: str = 'all', report_format: str = 'text',
+                 url_cache: Optional[str] = None, url_cache_max_age: timedelta = URL_CACHE_MAX_AGE,
+                 jobs: int = 1,
+                 validation_cache: Optional[str] = None,
+                 skip_domains: Optional[Set[str]] = None,
+                 findings_file: Optional[str] = None, findings_format: str = 'jsonl'):
         self.root_path = Path(root_path).resolve()
+        self.url_cache = Path(url_cache) if url_cache else None
+        self.url_cache_max_age = url_cache_max_age
         self.strict = strict
         self.verbose = verbose
         self.check_mode = check_mode
@@ -42,21 +566,228 @@ class RepositoryValidator:
         self.errors = []
         self.warnings = []
         self.url_details = {}  # Track detailed URL validation results
+
+        # Structured form of every error and warning, streamed when requested
+        self.findings: List[Dict] = []
+        self.findings_file = findings_file
+        self.findings_format = findings_format
+        self._finding_stream: Optional[FindingStream] = None
+
         self.stats = {
             'total_files': 0,
             'markdown_files': 0,
             'urls_found': 0,
             'broken_urls': 0,
+            'unchecked_urls': 0,
             'working_urls': 0,
             'redirected_urls': 0,
             'missing_files': 0,
             'bibliography_files': 0
         }
+        self.skip_domains = URL_SKIP_DOMAINS | set(skip_domains or ())
         self.IGNORED_DIRS = {'site', 'build', 'venv', '.audit-venv', 'uss-venv', 'papers-archive', '.git', '__pycache__', '.claude', '.gemini'}
         self.timestamp = datetime.now().isoformat()
 
-    def _is_ignored(self, path: Path) -> bool:
-        return any(part in self.IGNORED_DIRS for part in path.parts)
+        # File inventory shared by every check, filled once by _walk_repository
+        self.files: List[Path] = []
+        self.directories: List[Path] = []
+        self.markdown_files: List[Path] = []
+        self._walked = False
+
+        # Markdown text and derived artifacts, read once and shared by all checks
+        self._markdown_cache: Dict[Path, Dict] = {}
+
+        # Per-file checks are sharded across a process pool when jobs > 1
+        self.jobs = jobs
+        self._pool = None
+
+        # Internal link graph, built once by _build_link_graph
+        self.link_graph: Optional[LinkGraph] = None
+
+        # Where the time went: per-check wall time, bytes read, URL latencies
+        self.phase_timings: Dict[str, Dict] = {}
+        self.bytes_read = 0
+        self.url_latencies: List[float] = []
+
+        # Incremental runs reuse per-file results of unchanged files
+        self.validation_cache = Path(validation_cache) if validation_cache else None
+        self._file_cache: Dict[str, Dict] = self._load_validation_cache() if self.validation_cache else {}
+        self._unchanged: Dict[Path, Optional[Dict]] = {}
+
+    def _walk_repository(self):
+        """List the tree once with os.scandir, pruning IGNORED_DIRS before descending"""
+        if self._walked:
+            return
+
+        files = []
+        directories = []
+        pending = [self.root_path]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.name in self.IGNORED_DIRS:
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                directories.append(Path(entry.path))
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                files.append(Path(entry.path))
+                        except OSError:
+                            continue
+            except OSError as e:
+                self._add_finding('warning', 'unreadable-directory', f"Cannot read directory {current}: {e}",
+                                  self._relative(Path(current)))
+
+        self.files = sorted(files)
+        self.directories = sorted(directories)
+        self.markdown_files = [f for f in self.files if f.suffix == '.md']
+        self._walked = True
+
+    def _markdown(self, md_file: Path) -> Dict:
+        """Cache entry for a Markdown file, reading its text on first use"""
+        entry = self._markdown_cache.get(md_file)
+        if entry is None:
+            with open(md_file, 'r', encoding='utf-8') as f:
+                entry = {'content': f.read()}
+                self.bytes_read += os.fstat(f.fileno()).st_size
+            self._markdown_cache[md_file] = entry
+        return entry
+
+    def _markdown_content(self, md_file: Path) -> str:
+        return self._markdown(md_file)['content']
+
+    def _markdown_links(self, md_file: Path) -> List[Tuple[str, str, int, int]]:
+        """(text, target, line, column) of Markdown links outside code spans and blocks"""
+        entry = self._markdown(md_file)
+        if 'links' not in entry:
+            # Strip code blocks to avoid false positives in links; positions
+            # are mapped back to the original text
+            content_no_code, runs = strip_code(entry['content'])
+            entry['links'] = [
+                (match.group(1), match.group(2))
+                + line_column(entry['content'], original_offset(runs, match.start(2)))
+                for match in MARKDOWN_LINK_RE.finditer(content_no_code)
+            ]
+        return entry['links']
+
+    def _markdown_urls(self, md_file: Path) -> List[str]:
+        """External URLs referenced by a Markdown file"""
+        cached = self._unchanged_entry(md_file) if self.validation_cache else None
+        if cached and 'urls' in cached:
+            return cached['urls']
+
+        entry = self._markdown(md_file)
+        if 'urls' not in entry:
+            entry['urls'] = self._extract_urls(entry['content'])
+        if self.validation_cache:
+            try:
+                self._current_entry(md_file)['urls'] = entry['urls']
+            except OSError:
+                pass
+        return entry['urls']
+
+    def _cache_signature(self) -> str:
+        """Cached results are only reused by the same validator code, ignore list and URL skip list"""
+        digest = hashlib.sha256(Path(__file__).read_bytes())
+        digest.update(json.dumps(sorted(self.IGNORED_DIRS)).encode('utf-8'))
+        digest.update(json.dumps(sorted(self.skip_domains)).encode('utf-8'))
+        return f"{VALIDATION_CACHE_VERSION}:{digest.hexdigest()}"
+
+    def _load_validation_cache(self) -> Dict[str, Dict]:
+        try:
+            with open(self.validation_cache, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data.get('files', {}) if data.get('signature') == self._cache_signature() else {}
+
+    def _save_validation_cache(self):
+        # Drop entries of files that no longer exist
+        present = {str(f.relative_to(self.root_path)) for f in self.files}
+        files = {path: entry for path, entry in self._file_cache.items() if path in present}
+        try:
+            with open(self.validation_cache, 'w', encoding='utf-8') as f:
+                json.dump({'signature': self._cache_signature(), 'files': files}, f, sort_keys=True)
+        except OSError as e:
+            self._add_finding('warning', 'cache-write-failed',
+                              f"Could not write validation cache {self.validation_cache}: {e}")
+
+    def _unchanged_entry(self, file_path: Path) -> Optional[Dict]:
+        """Cache entry of a file if it is unchanged since it was cached.
+
+        Matching size and mtime are trusted; otherwise the content hash decides.
+        """
+        if file_path in self._unchanged:
+            return self._unchanged[file_path]
+
+        entry = self._file_cache.get(str(file_path.relative_to(self.root_path)))
+        if entry is not None:
+            try:
+                stat = file_path.stat()
+                if (entry['mtime_ns'], entry['size']) != (stat.st_mtime_ns, stat.st_size):
+                    if hashlib.sha256(file_path.read_bytes()).hexdigest() != entry['sha256']:
+                        entry = None
+                    else:
+                        entry['mtime_ns'] = stat.st_mtime_ns
+            except OSError:
+                entry = None
+
+        self._unchanged[file_path] = entry
+        return entry
+
+    def _current_entry(self, file_path: Path) -> Dict:
+        """Cache entry for a file's current content, replacing any stale one"""
+        entry = self._unchanged_entry(file_path)
+        if entry is None:
+            stat = file_path.stat()
+            entry = {
+                'sha256': hashlib.sha256(file_path.read_bytes()).hexdigest(),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'results': {}
+            }
+            self._file_cache[str(file_path.relative_to(self.root_path))] = entry
+            self._unchanged[file_path] = entry
+        return entry
+
+    def _cached_result(self, check: str, file_path: Path) -> Optional[List[Dict]]:
+        """Reusable findings of a per-file check, if any"""
+        if not self.validation_cache:
+            return None
+        entry = self._unchanged_entry(file_path)
+        if not entry or check not in entry['results']:
+            return None
+        return entry['results'][check]
+
+    def _store_result(self, check: str, file_path: Path, result: List[Dict]):
+        if not self.validation_cache:
+            return
+        try:
+            entry = self._current_entry(file_path)
+        except OSError:
+            return
+        entry['results'][check] = result
+
+    def _relative(self, path: Path) -> str:
+        """Repository-relative POSIX path used in findings"""
+        try:
+            return path.relative_to(self.root_path).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _add_finding(self, level: str, rule: str, message: str, file: Optional[str] = None,
+                     line: Optional[int] = None, column: Optional[int] = None):
+        self._record(make_finding(level, rule, message, file, line, column))
+
+    def _record(self, finding: Dict):
+        """Add a finding to the report and stream it if requested"""
+        (self.errors if finding['level'] == 'error' else self.warnings).append(finding['message'])
+        self.findings.append(finding)
+        if self._finding_stream:
+            self._finding_stream.write(finding)
 
     def validate_all(self) -> bool:
         """Run all validation checks"""
@@ -64,51 +795,221 @@ class RepositoryValidator:
             print(f" Starting comprehensive repository validation{' (STRICT MODE)' if self.strict else ''}...")
             print("=" * 60)
 
-        # Core validation checks based on check_mode
-        if self.check_mode in ('all', 'structure'):
-            self._scan_repository()
-            self._validate_directory_structure()
-        
-        if self.check_mode in ('all', 'structure', 'markdown'):
-            if self.check_mode != 'all':
-                self._scan_repository()  # Need file scan for markdown
-            self._validate_markdown_files()
-        
-        if self.check_mode in ('all', 'cross-references'):
-            if self.check_mode != 'all':
-                self._scan_repository()  # Need file scan
-            self._validate_cross_references()
-        
-        if self.check_mode in ('all', 'bibliography'):
-            if self.check_mode != 'all':
-                self._scan_repository()  # Need file scan
-            self._validate_bibliography_format()
-        
-        if self.check_mode in ('all', 'links', 'urls'):
-            if self.check_mode not in ('all',):
-                self._scan_repository()  # Need file scan
-            self._validate_urls()
+        if self.findings_file:
+            self._finding_stream = FindingStream(self.findings_file, self.findings_format, self.root_path)
+        try:
+            self._run_checks()
+        finally:
+            if self._finding_stream:
+                self._finding_stream.close()
+                self._finding_stream = None
 
         # Generate report
         return self._generate_report()
 
+    def _run_checks(self):
+        """Run the checks selected by check_mode, collecting errors and warnings"""
+        # Every check reads the same single-pass file inventory
+        self._timed('scan', self._scan_repository, lambda: len(self.files))
+
+        try:
+            # Core validation checks based on check_mode
+            if self.check_mode in ('all', 'structure'):
+                self._timed('structure', self._validate_directory_structure, lambda: len(self.directories))
+
+            if self.check_mode in ('all', 'structure', 'markdown'):
+                self._timed('markdown', self._validate_markdown_files, lambda: len(self.markdown_files))
+
+            if self.check_mode in ('all', 'cross-references'):
+                self._timed('cross-references', self._validate_cross_references, lambda: len(self.markdown_files))
+
+            if self.check_mode in ('all', 'bibliography'):
+                self._timed('bibliography', self._validate_bibliography_format,
+                            lambda: self.stats['bibliography_files'])
+
+            if self.check_mode in ('all', 'links', 'urls'):
+                self._timed('urls', self._validate_urls, lambda: self.stats['urls_found'])
+        finally:
+            if self._pool:
+                self._pool.shutdown()
+                self._pool = None
+            if self.validation_cache:
+                self._save_validation_cache()
+
+    def _timed(self, phase: str, check, items):
+        """Run one phase, recording its wall time, items processed and bytes read.
+
+        items is called afterwards, since most phases only know their
+        workload once they have run.
+        """
+        bytes_before = self.bytes_read
+        start = time.perf_counter()
+        try:
+            check()
+        finally:
+            seconds = time.perf_counter() - start
+            count = items()
+            self.phase_timings[phase] = {
+                'seconds': round(seconds, 4),
+                'items': count,
+                'items_per_sec': round(count / seconds, 1) if seconds > 0 else None,
+                'bytes_read': self.bytes_read - bytes_before
+            }
+
+    def _performance(self) -> Dict:
+        """Phase timings and URL latency percentiles for the report"""
+        checked = self.url_latencies
+        return {
+            'total_seconds': round(sum(p['seconds'] for p in self.phase_timings.values()), 4),
+            'bytes_read': self.bytes_read,
+            'jobs': self.jobs,
+            'incremental': self.validation_cache is not None,
+            'phases': self.phase_timings,
+            'url_latency_ms': {
+                'checked': len(checked),
+                'p50': percentile(checked, 0.5),
+                'p90': percentile(checked, 0.9),
+                'p99': percentile(checked, 0.99),
+                'max': max(checked) if checked else None
+            }
+        }
+
+    def _reset(self):
+        """Forget findings, the inventory and file contents before a rerun.
+
+        The incremental cache is kept, so unchanged files are not re-checked.
+        """
+        self.errors = []
+        self.warnings = []
+        self.findings = []
+        self.url_details = {}
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.timestamp = datetime.now().isoformat()
+        self.phase_timings = {}
+        self.bytes_read = 0
+        self.url_latencies = []
+        self._walked = False
+        self._markdown_cache.clear()
+        self._unchanged.clear()
+        self.link_graph = None
+
+    def watch(self, link_graph_file: Optional[str] = None):
+        """Validate, then revalidate on every change until interrupted.
+
+        Each rerun re-checks only changed files (through the incremental
+        cache) and prints the errors and warnings that appeared or were
+        resolved.
+        """
+        self.validate_all()
+        if link_graph_file:
+            self.save_link_graph(link_graph_file)
+
+        ignored = {path for path in (self.validation_cache, link_graph_file) if path}
+        watcher = RepositoryWatcher(self.root_path, self.IGNORED_DIRS, ignored)
+        print(f"\n[WATCH] Watching {self.root_path} ({watcher.backend}); press Ctrl+C to stop")
+
+        # Later runs only print what changed
+        self.report_format = 'json'  # silence progress output
+        previous = self._findings()
+        try:
+            while True:
+                changed = watcher.wait()
+                names = sorted(str(path.relative_to(self.root_path)) if path != self.root_path else '.'
+                               for path in changed)
+                shown = ', '.join(names[:5]) + (f" and {len(names) - 5} more" if len(names) > 5 else '')
+                print(f"\n[WATCH] {datetime.now():%H:%M:%S} changed: {shown}")
+
+                start = time.time()
+                self._reset()
+                self._run_checks()
+                if link_graph_file:
+                    self.save_link_graph(link_graph_file)
+                current = self._findings()
+
+                for (kind, message), _ in sorted((current - previous).items()):
+                    print(f"  + {kind}: {message}")
+                for (kind, message), _ in sorted((previous - current).items()):
+                    print(f"  - resolved {kind}: {message}")
+                if current == previous:
+                    print("  No new or resolved findings")
+                print(f"  {len(self.errors)} errors, {len(self.warnings)} warnings "
+                      f"({time.time() - start:.2f}s)")
+                previous = current
+        except KeyboardInterrupt:
+            print("\n[WATCH] Stopped")
+        finally:
+            watcher.close()
+
+    def _findings(self) -> Counter:
+        return Counter([('error', e) for e in self.errors] + [('warning', w) for w in self.warnings])
+
     def _scan_repository(self):
         """Scan repository for files and basic statistics"""
         if self.report_format == 'text':
             print("[METRICS] Scanning repository structure...")
 
-        for file_path in self.root_path.rglob('*'):
-            if self._is_ignored(file_path):
-                continue
+        self._walk_repository()
+
+        for file_path in self.files:
+            self.stats['total_files'] += 1
+
+            if file_path.suffix == '.md':
+                self.stats['markdown_files'] += 1
 
-            if file_path.is_file():
-                self.stats['total_files'] += 1
+            if 'bibliography' in file_path.name.lower():
+                self.stats['bibliography_files'] += 1
 
-                if file_path.suffix == '.md':
-                    self.stats['markdown_files'] += 1
+    def _check_file(self, check: str, file_path: Path) -> List[Dict]:
+        return {
+            'markdown': self._check_markdown_file,
+            'bibliography': self._check_bibliography_file
+        }[check](file_path)
 
-                if 'bibliography' in file_path.name.lower():
-                    self.stats['bibliography_files'] += 1
+    def _run_file_check(self, check: str, files: List[Path]):
+        """Run a per-file check over files, in a process pool when jobs > 1
+        and at least PARALLEL_MIN_FILES files need checking.
+
+        Files with a reusable cached result are skipped. Results are merged
+        in input order, so the report is identical to a sequential run.
+        Workers send back the text they read, so later checks do not read
+        those files again.
+        """
+        results = {}
+        pending = []
+        for f in files:
+            cached = self._cached_result(check, f)
+            if cached is not None:
+                results[f] = cached
+            else:
+                pending.append(f)
+
+        # Files already read by an earlier check are not sent to workers
+        unread = [f for f in pending if f not in self._markdown_cache]
+        if self.jobs > 1 and len(unread) >= PARALLEL_MIN_FILES:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+            chunk_size = max(1, len(unread) // (self.jobs * 4))
+            chunks = [unread[i:i + chunk_size] for i in range(0, len(unread), chunk_size)]
+            checked = []
+            for chunk_results, contents, bytes_read in self._pool.map(
+                _check_file_batch,
+                [(str(self.root_path), check, chunk) for chunk in chunks]
+            ):
+                checked.extend(chunk_results)
+                self.bytes_read += bytes_read
+                for path, content in contents.items():
+                    self._markdown_cache.setdefault(Path(path), {'content': content})
+            for f, result in zip(unread, checked):
+                results[f] = result
+
+        for f in pending:
+            if f not in results:
+                results[f] = self._check_file(check, f)
+            self._store_result(check, f, results[f])
+
+        for f in files:
+            for finding in results[f]:
+                self._record(finding)
 
     def _validate_directory_structure(self):
         """Validate expected directory structure"""
@@ -116,8 +1017,7 @@ class RepositoryValidator:
             print(" Validating directory structure...")
 
         # Find all numbered directories recursively
-        numbered_dirs = [d for d in self.root_path.rglob('*') 
-                         if d.is_dir() and re.match(r'^\d{2}-', d.name) and not self._is_ignored(d)]
+        numbered_dirs = [d for d in self.directories if re.match(r'^\d{2}-', d.name)]
         found_names = {d.name[:3] for d in numbered_dirs} # e.g. "01-"
 
         # Check for numbered directories (01-31)
@@ -129,7 +1029,7 @@ class RepositoryValidator:
                 missing_dirs.append(expected)
 
         if missing_dirs:
-            self.warnings.append(f"Missing expected directories: {missing_dirs}")
+            self._add_finding('warning', 'missing-directory', f"Missing expected directories: {missing_dirs}")
 
         # Check for required subdirectories in numbered dirs
         for dir_path in numbered_dirs:
@@ -137,177 +1037,253 @@ class RepositoryValidator:
             for subdir in required_subdirs:
                 subdir_path = dir_path / subdir
                 if not subdir_path.exists():
-                    self.warnings.append(f"Missing {subdir}/ in {dir_path.name}")
+                    self._add_finding('warning', 'missing-directory', f"Missing {subdir}/ in {dir_path.name}",
+                                      self._relative(dir_path))
 
     def _validate_markdown_files(self):
         """Validate markdown file structure and content"""
         if self.report_format == 'text':
             print(" Validating markdown files...")
 
-        for md_file in self.root_path.rglob('*.md'):
-            if self._is_ignored(md_file):
-                continue
+        self._run_file_check('markdown', self.markdown_files)
 
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Check for basic structure
-                if not content.strip():
-                    self.errors.append(f"Empty markdown file: {md_file.relative_to(self.root_path)}")
-                    continue
-
-                # Check for proper headers
-                if not content.startswith('#'):
-                    self.warnings.append(f"No top-level header in: {md_file.relative_to(self.root_path)}")
-
-                # Check for index files in numbered directories
-                if md_file.name == 'index.md':
-                    parent_dir = md_file.parent.name
-                    if re.match(r'^\d{2}-', parent_dir):
-                        # Validate index content requirements
-                        required_sections = ['overview', 'syntax', 'properties', 'resources']
-                        content_lower = content.lower()
-                        missing_sections = [s for s in required_sections if s not in content_lower]
-
-                        if missing_sections:
-                            self.warnings.append(
-                                f"Index {parent_dir} missing sections: {missing_sections}"
-                            )
+    def _check_markdown_file(self, md_file: Path) -> List[Dict]:
+        """Structure checks for one Markdown file. Returns findings"""
+        findings = []
+        file = self._relative(md_file)
+        try:
+            content = self._markdown_content(md_file)
+
+            # Check for basic structure
+            if not content.strip():
+                findings.append(make_finding(
+                    'error', 'empty-markdown', f"Empty markdown file: {md_file.relative_to(self.root_path)}", file
+                ))
+                return findings
+
+            # Check for proper headers
+            if not content.startswith('#'):
+                findings.append(make_finding(
+                    'warning', 'missing-title', f"No top-level header in: {md_file.relative_to(self.root_path)}",
+                    file, 1, 1
+                ))
+
+            # Check for index files in numbered directories
+            if md_file.name == 'index.md':
+                parent_dir = md_file.parent.name
+                if re.match(r'^\d{2}-', parent_dir):
+                    # Validate index content requirements
+                    required_sections = ['overview', 'syntax', 'properties', 'resources']
+                    content_lower = content.lower()
+                    missing_sections = [s for s in required_sections if s not in content_lower]
+
+                    if missing_sections:
+                        findings.append(make_finding(
+                            'warning', 'missing-section',
+                            f"Index {parent_dir} missing sections: {missing_sections}", file
+                        ))
 
-            except Exception as e:
-                self.errors.append(f"Error reading {md_file.relative_to(self.root_path)}: {e}")
+        except Exception as e:
+            findings.append(make_finding(
+                'error', 'read-error', f"Error reading {md_file.relative_to(self.root_path)}: {e}", file
+            ))
+
+        return findings
 
     def _extract_urls(self, content: str) -> List[str]:
         """Extract URLs from markdown content"""
-        # Pattern for markdown links and raw URLs
-        url_patterns = [
-            r'\[([^\]]+)\]\(([^)]+)\)',  # [text](url)
-            r'<(https?://[^>]+)>',       # <url>
-            r'(?:^|\s)(https?://\S+)'    # raw URLs
-        ]
-
         urls = []
-        for pattern in url_patterns:
-            matches = re.findall(pattern, content)
-            for match in matches:
-                if isinstance(match, tuple):
-                    url = match[-1]  # Get the URL part
-                else:
-                    url = match
-
-                # Clean up the URL
-                url = url.strip().rstrip('.,;:)')
-                if url.startswith(('http://', 'https://')):
-                    if 'localhost' in url or '127.0.0.1' in url or 'Oichkatzelesfrettschen' in url or 'doi.org' in url or 'cambridge.org' in url or 'sciencedirect.com' in url or 'repository.ubn.ru.nl' in url or 'ics.uci.edu' in url or 'archives-ouvertes.fr' in url:
-                        continue
-                    urls.append(url)
+        for _, url, _ in iter_link_tokens(content):
+            # Clean up the URL
+            url = url.strip().rstrip('.,;:)')
+            if url.startswith(('http://', 'https://')) and not self._skip_url(url):
+                urls.append(url)
 
         return urls
 
+    def _skip_url(self, url: str) -> bool:
+        """True if the URL's host (or a parent domain) is skip-listed"""
+        try:
+            host = urlparse(url).hostname or ''
+        except ValueError:
+            host = ''
+        labels = host.split('.')
+        if any('.'.join(labels[i:]) in self.skip_domains for i in range(len(labels))):
+            return True
+        return any(marker in url for marker in URL_SKIP_SUBSTRINGS)
+
     def _validate_cross_references(self):
         """Validate internal cross-references and links"""
         if self.report_format == 'text':
             print(" Validating cross-references...")
 
-        all_files = set()
-        # Track Markdown files
-        for md_file in self.root_path.rglob('*.md'):
-            if self._is_ignored(md_file):
-                continue
-            all_files.add(md_file.relative_to(self.root_path))
-        # Also track common static assets (at minimum PDFs for internal links)
-        for asset in self.root_path.rglob('*'):
-            if self._is_ignored(asset):
-                continue
-            try:
-                if asset.is_file() and asset.suffix.lower() in {'.pdf'}:
-                    all_files.add(asset.relative_to(self.root_path))
-            except Exception:
-                continue
+        graph = self._build_link_graph()
 
-        for md_file in self.root_path.rglob('*.md'):
-            if self._is_ignored(md_file):
-                continue
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+        for md_file in self.markdown_files:
+            source = md_file.relative_to(self.root_path).as_posix()
+            for _, target, _, link_url, line, column in graph.outgoing(source):
+                if target is None:
+                    self._add_finding(
+                        'error', 'broken-link',
+                        f"Broken internal link in {source}: '{link_url}' -> outside repository",
+                        source, line, column
+                    )
+                elif not graph.exists(target) and not self._ignored_target_exists(target):
+                    self._add_finding(
+                        'error', 'broken-link',
+                        f"Broken internal link in {source}: '{link_url}' -> {target}",
+                        source, line, column
+                    )
 
-                # Strip code blocks to avoid false positives in links
-                content_no_code = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-                content_no_code = re.sub(r'`.*?`', '', content_no_code)
+        # Fragments are looked up in each target's anchor index
+        for source, target, anchor, link_url, line, column in graph.broken_anchors():
+            self._add_finding(
+                'error', 'broken-anchor',
+                f"Broken anchor in {source}: '{link_url}' -> {target}#{anchor}",
+                source, line, column
+            )
 
-                # Find relative links in non-code content
-                relative_links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content_no_code)
+    def _ignored_target_exists(self, target: str) -> bool:
+        """True if target is a file under IGNORED_DIRS, which the graph does not index"""
+        # The scan prunes ignored directories at any depth
+        return (not self.IGNORED_DIRS.isdisjoint(target.split('/')[:-1])
+                and (self.root_path / target).is_file())
 
-                for link_text, link_url in relative_links:
-                    # Skip external URLs
-                    if link_url.startswith(('http://', 'https://', 'mailto:')):
-                        continue
+    def _build_link_graph(self) -> LinkGraph:
+        """Build the internal link graph once from every Markdown file"""
+        if self.link_graph is not None:
+            return self.link_graph
 
-                    # Skip anchors
-                    if link_url.startswith('#'):
-                        continue
+        graph = LinkGraph()
 
-                    # Strip anchors or query strings for file existence check
-                    clean_url = link_url.split('#', 1)[0].split('?', 1)[0]
+        # Track common static assets (at minimum PDFs for internal links)
+        for f in self.files:
+            if f.suffix.lower() in {'.pdf'}:
+                graph.add_node(f.relative_to(self.root_path).as_posix(), 'asset')
 
-                    # Resolve relative path
-                    if clean_url.startswith('../'):
-                        # Handle relative paths
-                        target_path = (md_file.parent / clean_url).resolve()
-                        relative_target = target_path.relative_to(self.root_path)
-                    else:
-                        relative_target = md_file.parent / clean_url
-                        try:
-                            relative_target = relative_target.relative_to(self.root_path)
-                        except ValueError:
-                            continue
+        for md_file in self.markdown_files:
+            source = md_file.relative_to(self.root_path).as_posix()
+            try:
+                links = self._file_links(md_file)
+            except Exception as e:
+                graph.add_node(source, 'doc')
+                self._add_finding('warning', 'read-error',
+                                  f"Error checking cross-references in {md_file.name}: {e}", source)
+                continue
 
-                    # If the target exists on disk and is tracked in all_files, accept it
-                    if relative_target not in all_files:
-                        self.errors.append(
-                            f"Broken internal link in {md_file.relative_to(self.root_path)}: "
-                            f"'{link_url}' -> {relative_target}"
-                        )
+            graph.add_node(source, 'doc', links['anchors'])
+            for target, anchor, link_url, line, column in links['edges']:
+                graph.add_edge(source, target, anchor, link_url, line, column)
 
-            except Exception as e:
-                self.warnings.append(f"Error checking cross-references in {md_file.name}: {e}")
+        self.link_graph = graph
+        return graph
+
+    def _file_links(self, md_file: Path) -> Dict:
+        """Outgoing internal links and heading anchors of a Markdown file.
+
+        Returns {'edges': [(target, anchor, link, line, column)], 'anchors': [...]},
+        reusing the incremental cache for unchanged files.
+        """
+        cached = self._unchanged_entry(md_file) if self.validation_cache else None
+        if cached and 'links' in cached:
+            return cached['links']
+
+        edges = []
+        for _, link_url, line, column in self._markdown_links(md_file):
+            internal = self._internal_link_target(md_file, link_url)
+            if internal is not None:
+                edges.append(internal + (link_url, line, column))
+
+        links = {'edges': edges, 'anchors': self._heading_anchors(md_file)}
+        if self.validation_cache:
+            try:
+                self._current_entry(md_file)['links'] = links
+            except OSError:
+                pass
+        return links
+
+    def save_link_graph(self, output_file: str):
+        """Write the link graph (nodes, edges, backlinks, orphans, broken anchors) as JSON"""
+        if not self._walked:
+            self._scan_repository()
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(self._build_link_graph().to_dict(), f, indent=2)
+
+    def _heading_anchors(self, md_file: Path) -> List[str]:
+        """Fragment ids the rendered page defines (headings, HTML ids, footnotes)"""
+        return extract_anchors(self._markdown_content(md_file))
+
+    def _internal_link_target(self, md_file: Path, link_url: str) -> Optional[Tuple[Optional[str], str]]:
+        """(target, anchor) of an internal link, or None for external links.
+
+        The target is a normalised repository-relative POSIX path (the file
+        itself for '#anchor' links), or None when the link leaves the
+        repository.
+        """
+        # Skip external URLs
+        if link_url.startswith(('http://', 'https://', 'mailto:')):
+            return None
+
+        # Strip anchors or query strings for file existence check
+        path_part, _, anchor = link_url.partition('#')
+        clean_url = path_part.split('?', 1)[0]
+        source = md_file.relative_to(self.root_path).as_posix()
+
+        # Same-page anchors
+        if not clean_url:
+            return source, anchor
+
+        # Resolve lexically, with root-absolute links relative to the repository root
+        base = '' if clean_url.startswith('/') else posixpath.dirname(source)
+        target = posixpath.normpath(posixpath.join(base, clean_url.lstrip('/')))
+        if target == '..' or target.startswith('../'):
+            return None, anchor
+        return target, anchor
 
     def _validate_bibliography_format(self):
         """Validate bibliography file formatting"""
         if self.report_format == 'text':
             print("[DOCS] Validating bibliography formatting...")
 
-        bibliography_files = list(self.root_path.rglob('*bibliography*.md'))
+        bibliography_files = [
+            f for f in self.markdown_files
+            if 'bibliography' in f.name and f.name != 'comprehensive-bibliography.md'
+        ]
+        self._run_file_check('bibliography', bibliography_files)
 
-        for bib_file in bibliography_files:
-            if self._is_ignored(bib_file) or bib_file.name == 'comprehensive-bibliography.md':
-                continue
-            try:
-                with open(bib_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+    def _check_bibliography_file(self, bib_file: Path) -> List[Dict]:
+        """Citation format checks for one bibliography file. Returns findings"""
+        findings = []
+        file = self._relative(bib_file)
+        try:
+            content = self._markdown_content(bib_file)
 
-                # Check for standard citation format (Bold Author (Year) or Header Author (Year))
-                citations = re.findall(r'(?:\*\*|###\s+)([^*#\n]+?)\s*\((\d{4}(?:-\d{4})?)\)', content)
+            # Check for standard citation format (Bold Author (Year) or Header Author (Year))
+            citations = re.findall(r'(?:\*\*|###\s+)([^*#\n]+?)\s*\((\d{4}(?:-\d{4})?)\)', content)
 
-                if not citations:
-                    self.warnings.append(
-                        f"No standard citations found in {bib_file.relative_to(self.root_path)}"
-                    )
-                    continue
+            if not citations:
+                findings.append(make_finding(
+                    'warning', 'no-citations',
+                    f"No standard citations found in {bib_file.relative_to(self.root_path)}", file
+                ))
+                return findings
 
-                # Check for DOI presence
-                doi_count = len(re.findall(r'DOI.*?10\.\d+', content, re.IGNORECASE))
+            # Check for DOI presence
+            doi_count = len(re.findall(r'DOI.*?10\.\d+', content, re.IGNORECASE))
 
-                if doi_count < len(citations) * 0.0:  # Suppress DOI coverage warnings
-                    self.warnings.append(
-                        f"Low DOI coverage in {bib_file.relative_to(self.root_path)}: "
-                        f"{doi_count}/{len(citations)}"
-                    )
+            if doi_count < len(citations) * 0.0:  # Suppress DOI coverage warnings
+                findings.append(make_finding(
+                    'warning', 'low-doi-coverage',
+                    f"Low DOI coverage in {bib_file.relative_to(self.root_path)}: "
+                    f"{doi_count}/{len(citations)}", file
+                ))
 
-            except Exception as e:
-                self.errors.append(f"Error validating {bib_file.relative_to(self.root_path)}: {e}")
+        except Exception as e:
+            findings.append(make_finding(
+                'error', 'read-error', f"Error validating {bib_file.relative_to(self.root_path)}: {e}", file
+            ))
+
+        return findings
 
     def _check_url(self, url: str, timeout: int = 10) -> Tuple[str, bool, str, Optional[str]]:
         """Check if a URL is accessible. Returns (url, is_valid, message, final_url)"""
@@ -358,6 +1334,29 @@ class RepositoryValidator:
         except Exception as e:
             return url, False, f"Error: {str(e)}", None
 
+    def _link_result_to_check(self, result: Dict) -> Tuple[bool, str, Optional[str]]:
+        """Map a LinkChecker result onto (is_valid, message, final_url) like _check_url"""
+        status = result['status']
+        code = result.get('status_code')
+
+        if status.startswith('accessible') or status == 'redirect':
+            final_url = result.get('redirect_url')
+            if final_url:
+                self.stats['redirected_urls'] += 1
+            return True, f"HTTP {code}", final_url
+        elif status == 'access_denied':
+            return True, f"HTTP {code} (restricted)", None
+        elif status == 'timeout':
+            return False, "Request timeout", None
+        elif status == 'circuit_open':
+            # No request was made; reported separately from broken URLs
+            return False, "Not checked (host circuit open)", None
+        elif status == 'client_error':
+            return False, f"Connection failed: {result.get('error')}", None
+        elif code is not None:
+            return False, f"HTTP {code}", None
+        return False, f"Error: {result.get('error')}", None
+
     def _validate_urls(self):
         """Validate all URLs in the repository"""
         if self.report_format == 'text':
@@ -367,14 +1366,9 @@ class RepositoryValidator:
         url_sources = {}
 
         # Collect all URLs
-        for md_file in self.root_path.rglob('*.md'):
-            if self._is_ignored(md_file):
-                continue
+        for md_file in self.markdown_files:
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                urls = self._extract_urls(content)
+                urls = self._markdown_urls(md_file)
                 for url in urls:
                     all_urls.add(url)
                     if url not in url_sources:
@@ -382,7 +1376,8 @@ class RepositoryValidator:
                     url_sources[url].append(md_file.relative_to(self.root_path))
 
             except Exception as e:
-                self.warnings.append(f"Error extracting URLs from {md_file.name}: {e}")
+                self._add_finding('warning', 'read-error', f"Error extracting URLs from {md_file.name}: {e}",
+                                  self._relative(md_file))
 
         self.stats['urls_found'] = len(all_urls)
 
@@ -394,69 +1389,112 @@ class RepositoryValidator:
         if self.report_format == 'text':
             print(f"  Found {len(all_urls)} unique URLs to validate...")
 
-        # Validate URLs in parallel (but be respectful)
-        broken_urls = []
-        restricted_urls = []
-
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            # Submit URL validation jobs
-            future_to_url = {
-                executor.submit(self._check_url, url): url
-                for url in list(all_urls)
+        completed = 0
+        total_urls = len(all_urls)
+
+        def record(url: str, is_valid: bool, message: str, final_url: Optional[str],
+                   latency_ms: Optional[float] = None) -> None:
+            nonlocal completed
+            completed += 1
+            if latency_ms is not None:
+                self.url_latencies.append(latency_ms)
+
+            unchecked = message.startswith('Not checked')
+
+            # Store detailed result
+            self.url_details[url] = {
+                'status': 'OK' if is_valid else 'SKIPPED' if unchecked else 'FAILED',
+                'message': message,
+                'final_url': final_url,
+                'redirected': final_url is not None,
+                'latency_ms': latency_ms,
+                'sources': [str(s) for s in url_sources[url]]
             }
 
-            completed = 0
-            total_urls = len(all_urls)
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    url, is_valid, message, final_url = future.result()
-                    completed += 1
-
-                    # Store detailed result
-                    self.url_details[url] = {
-                        'status': 'OK' if is_valid else 'FAILED',
-                        'message': message,
-                        'final_url': final_url,
-                        'redirected': final_url is not None,
-                        'sources': [str(s) for s in url_sources[url]]
-                    }
-
-                    if self.verbose and self.report_format == 'text':
-                        status = "[OK]" if is_valid else "[FAIL]"
-                        print(f"  [{completed}/{total_urls}] {status} {url[:60]}... - {message}")
-                    elif self.report_format == 'text' and completed % 10 == 0:
-                        print(f"  Progress: {completed}/{total_urls} URLs checked")
-
-                    if is_valid:
-                        self.stats['working_urls'] += 1
-                    elif not is_valid:
-                        if 'restricted' in message or 'HTTP 401' in message or 'HTTP 403' in message:
-                            restricted_urls.append((url, message, url_sources[url]))
-                        else:
-                            broken_urls.append((url, message, url_sources[url]))
-                            self.stats['broken_urls'] += 1
-
-                except Exception as e:
-                    self.warnings.append(f"Error checking URL {url}: {e}")
-
-                # Be respectful - small delay between requests
-                time.sleep(0.1)
-
-        # Report broken URLs
-        for url, error, sources in broken_urls:
-            source_list = ', '.join(str(s) for s in sources[:3])
-            if len(sources) > 3:
-                source_list += f" (and {len(sources)-3} more)"
+            if self.verbose and self.report_format == 'text':
+                status = "[OK]" if is_valid else "[FAIL]"
+                print(f"  [{completed}/{total_urls}] {status} {url[:60]}... - {message}")
+            elif self.report_format == 'text' and completed % 10 == 0:
+                print(f"  Progress: {completed}/{total_urls} URLs checked")
 
-            self.errors.append(f"Broken URL: {url} ({error}) in {source_list}")
+            if is_valid:
+                self.stats['working_urls'] += 1
+                return
 
-        # Report restricted URLs as warnings
-        for url, error, sources in restricted_urls:
+            # Findings are recorded (and streamed) as each result arrives
+            sources = url_sources[url]
             source_list = ', '.join(str(s) for s in sources[:3])
             if len(sources) > 3:
                 source_list += f" (and {len(sources)-3} more)"
-            self.warnings.append(f"Access-restricted URL: {url} ({error}) in {source_list}")
+            location = self._url_location(url, sources)
+
+            if unchecked:
+                # Skipped because the host kept failing: a warning, not an error
+                self.stats['unchecked_urls'] += 1
+                self._add_finding('warning', 'unchecked-url',
+                                  f"URL not checked (host circuit open): {url} in {source_list}", *location)
+            elif 'restricted' in message or 'HTTP 401' in message or 'HTTP 403' in message:
+                self._add_finding('warning', 'restricted-url',
+                                  f"Access-restricted URL: {url} ({message}) in {source_list}", *location)
+            else:
+                self.stats['broken_urls'] += 1
+                self._add_finding('error', 'broken-url',
+                                  f"Broken URL: {url} ({message}) in {source_list}", *location)
+
+        if HAS_LINK_CHECKER:
+            # One pooled session with per-host limits, retries and the result
+            # cache shared with papers-archive/scripts/verify_access.py
+            checker = LinkChecker(
+                LINK_CHECK_POLICIES,
+                LINK_CHECK_WORKERS,
+                cache=ResultCache(self.url_cache) if self.url_cache else None,
+                timeout=LINK_CHECK_TIMEOUT
+            )
+            checker.run(
+                sorted(all_urls),
+                # The archive keeps results for up to a week; a validation
+                # run should not trust them that long
+                ttls=dict.fromkeys(all_urls, self.url_cache_max_age),
+                on_result=lambda result: record(
+                    result['url'], *self._link_result_to_check(result),
+                    # Cached results cost no request
+                    None if result.get('cached') else (result.get('timings') or {}).get('total')
+                )
+            )
+        else:
+            def timed_check(url: str) -> Tuple[str, bool, str, Optional[str], float]:
+                start = time.perf_counter()
+                return self._check_url(url) + (round((time.perf_counter() - start) * 1000, 1),)
+
+            # Validate URLs in parallel (but be respectful)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                # Submit URL validation jobs
+                future_to_url = {
+                    executor.submit(timed_check, url): url
+                    for url in list(all_urls)
+                }
+
+                for future in as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        record(*future.result())
+                    except Exception as e:
+                        self._add_finding('warning', 'url-check-error', f"Error checking URL {url}: {e}",
+                                          *self._url_location(url, url_sources[url]))
+
+                    # Be respectful - small delay between requests
+                    time.sleep(0.1)
+
+    def _url_location(self, url: str, sources: List[Path]) -> Tuple[str, Optional[int], Optional[int]]:
+        """(file, line, column) of a URL's first occurrence in its first source"""
+        md_file = self.root_path / sources[0]
+        try:
+            offset = self._markdown_content(md_file).find(url)
+        except OSError:
+            offset = -1
+        if offset < 0:
+            return self._relative(md_file), None, None
+        return (self._relative(md_file),) + line_column(self._markdown_content(md_file), offset)
 
     def _generate_report(self) -> bool:
         """Generate validation report in requested format"""
@@ -479,6 +1517,7 @@ class RepositoryValidator:
             'errors': self.errors,
             'warnings': self.warnings,
             'url_details': self.url_details if self.verbose else {},
+            'performance': self._performance(),
             'success': success
         }
         
@@ -505,6 +1544,19 @@ class RepositoryValidator:
         if data['stats']['urls_found'] > 0:
             print(f"  URL Success Rate: {data['success_rate']:.1f}%")
 
+        # Performance
+        performance = data['performance']
+        print(f"\n[TIMING] Performance ({performance['total_seconds']:.2f}s, "
+              f"{performance['bytes_read'] / 1024:.0f} KiB read):")
+        for phase, timing in performance['phases'].items():
+            rate = f", {timing['items_per_sec']:.0f}/s" if timing['items_per_sec'] else ''
+            print(f"  {phase}: {timing['seconds']:.3f}s, {timing['items']} items{rate}, "
+                  f"{timing['bytes_read'] / 1024:.0f} KiB")
+        latency = performance['url_latency_ms']
+        if latency['checked']:
+            print(f"  URL latency: p50 {latency['p50']:.0f} ms, p90 {latency['p90']:.0f} ms, "
+                  f"p99 {latency['p99']:.0f} ms, max {latency['max']:.0f} ms ({latency['checked']} requests)")
+
         # Errors
         if data['errors']:
             print(f"\n[FAIL] Errors ({len(data['errors'])}):")
@@ -565,6 +1617,22 @@ class RepositoryValidator:
             md += f"| URL Success Rate | {data['success_rate']:.1f}% |\n"
         
         md += "\n"
+
+        # Performance
+        performance = data['performance']
+        md += "## Performance\n\n"
+        md += f"Total {performance['total_seconds']:.2f}s, {performance['bytes_read'] / 1024:.0f} KiB read\n\n"
+        md += "| Phase | Seconds | Items | Items/s | KiB read |\n"
+        md += "|-------|---------|-------|---------|----------|\n"
+        for phase, timing in performance['phases'].items():
+            rate = f"{timing['items_per_sec']:.0f}" if timing['items_per_sec'] else '-'
+            md += (f"| {phase} | {timing['seconds']:.3f} | {timing['items']} | {rate} | "
+                   f"{timing['bytes_read'] / 1024:.0f} |\n")
+        latency = performance['url_latency_ms']
+        if latency['checked']:
+            md += (f"\nURL latency ({latency['checked']} requests): p50 {latency['p50']:.0f} ms, "
+                   f"p90 {latency['p90']:.0f} ms, p99 {latency['p99']:.0f} ms, max {latency['max']:.0f} ms\n")
+        md += "\n"
         
         # Errors
         if data['errors']:
@@ -587,6 +1655,18 @@ class RepositoryValidator:
         print(md)
         return data['success']
 
+def _check_file_batch(task: Tuple[str, str, List[Path]]) -> Tuple[List[List[Dict]], Dict[str, str], int]:
+    """Process pool worker: run one per-file check over a chunk of files.
+
+    Returns the per-file results, the text of each file read and the
+    number of bytes read.
+    """
+    root_path, check, files = task
+    validator = RepositoryValidator(root_path, report_format='json')
+    results = [validator._check_file(check, f) for f in files]
+    contents = {str(path): entry['content'] for path, entry in validator._markdown_cache.items()}
+    return results, contents, validator.bytes_read
+
 def main():
     """Main validation entry point"""
     import argparse
@@ -602,6 +1682,8 @@ Examples:
   %(prog)s --report=json                      # Output as JSON
   %(prog)s --report=markdown --output=report.md  # Save Markdown report
   %(prog)s --strict --verbose                 # Strict mode with detailed output
+  %(prog)s --watch --check=cross-references   # Revalidate links while editing
+  %(prog)s --findings=findings.sarif --findings-format=sarif  # Code-scanning upload
   
 Check modes: all, links, urls, structure, markdown, cross-references, bibliography
 Report formats: text, json, markdown
@@ -642,7 +1724,108 @@ Report formats: text, json, markdown
         help='Write report to file instead of stdout'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Worker processes for per-file checks on trees of at least '
+             f'{PARALLEL_MIN_FILES} files (0 = one per CPU, default: 1)'
+    )
+    
+    parser.add_argument(
+        '--link-graph',
+        type=str,
+        metavar='FILE',
+        help='Write the internal link graph (edges, backlinks, orphans, anchors) as JSON'
+    )
+    
+    parser.add_argument(
+        '--backlinks',
+        type=str,
+        metavar='PATH',
+        help='List the documents linking to PATH and exit'
+    )
+    
+    parser.add_argument(
+        '--orphans',
+        action='store_true',
+        help='List documents no other document links to and exit'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help=f'Only re-check files changed since the last run (cache: {DEFAULT_VALIDATION_CACHE})'
+    )
+    
+    parser.add_argument(
+        '--validation-cache',
+        type=str,
+        default=str(DEFAULT_VALIDATION_CACHE),
+        help='Per-file result cache used by --incremental'
+    )
+    
+    parser.add_argument(
+        '--findings',
+        type=str,
+        metavar='FILE',
+        help='Stream every error and warning (rule, file, line, column, message) to FILE as it is found'
+    )
+
+    parser.add_argument(
+        '--findings-format',
+        choices=FINDINGS_FORMATS,
+        default='jsonl',
+        help='Format of --findings: one JSON object per line, or a SARIF 2.1.0 log (default: jsonl)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        type=str,
+        metavar='FILE',
+        help='Profile the run with cProfile and write pstats data to FILE '
+             '(per-file checks run in workers are not profiled when --jobs > 1)'
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Stay running and revalidate changed files on every save (implies --incremental)'
+    )
+
+    parser.add_argument(
+        '--skip-domain',
+        action='append',
+        default=[],
+        metavar='DOMAIN',
+        help='Do not check URLs on DOMAIN or its subdomains (repeatable)'
+    )
+
+    parser.add_argument(
+        '--url-cache',
+        type=str,
+        default=str(DEFAULT_URL_CACHE),
+        help=f'URL result cache shared with the papers archive (default: {DEFAULT_URL_CACHE})'
+    )
+    
+    parser.add_argument(
+        '--url-cache-max-age',
+        type=float,
+        default=URL_CACHE_MAX_AGE.total_seconds() / 3600,
+        metavar='HOURS',
+        help='Re-check cached URL results older than this many hours '
+             f'(default: {URL_CACHE_MAX_AGE.total_seconds() / 3600:g})'
+    )
+
+    parser.add_argument(
+        '--no-url-cache',
+        action='store_true',
+        help='Re-check every URL and do not update the URL cache'
+    )
+    
     args = parser.parse_args()
+    if args.watch and (args.output or args.findings):
+        parser.error('--watch prints to the terminal and cannot be combined with --output or --findings')
     
     # Normalize check mode (links == urls)
     check_mode = 'urls' if args.check == 'links' else args.check
@@ -653,9 +1836,30 @@ Report formats: text, json, markdown
         strict=args.strict,
         verbose=args.verbose,
         check_mode=check_mode,
-        report_format=args.report
+        report_format=args.report,
+        url_cache=None if args.no_url_cache else args.url_cache,
+        url_cache_max_age=timedelta(hours=args.url_cache_max_age),
+        jobs=args.jobs or os.cpu_count() or 1,
+        validation_cache=args.validation_cache if args.incremental or args.watch else None,
+        skip_domains=set(args.skip_domain),
+        findings_file=args.findings,
+        findings_format=args.findings_format
     )
     
+    # Link graph queries skip the validation run
+    if args.backlinks or args.orphans:
+        validator.report_format = 'json'  # silence progress output
+        validator._scan_repository()
+        graph = validator._build_link_graph()
+        paths = graph.backlinks(posixpath.normpath(args.backlinks)) if args.backlinks else graph.orphans()
+        for path in paths:
+            print(path)
+        sys.exit(0)
+    
+    if args.watch:
+        validator.watch(args.link_graph)
+        sys.exit(0)
+
     # Redirect output if requested
     original_stdout = sys.stdout
     if args.output:
@@ -667,13 +1871,29 @@ Report formats: text, json, markdown
             sys.exit(1)
     
     # Run validation
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
     try:
         success = validator.validate_all()
     finally:
+        if profiler:
+            profiler.disable()
         if args.output:
             sys.stdout.close()
             sys.stdout = original_stdout
             print(f"Report written to: {args.output}")
+
+    if profiler:
+        import pstats
+        profiler.dump_stats(args.profile)
+        print(f"Profile written to: {args.profile} (inspect with: python -m pstats {args.profile})", file=sys.stderr)
+        pstats.Stats(profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(15)
+    
+    if args.link_graph:
+        validator.save_link_graph(args.link_graph)
     
     # Exit code for CI compatibility
     sys.exit(0 if success else 1)